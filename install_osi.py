@@ -113,7 +113,6 @@ class OSIInstaller:
 
         # Install dependencies
         dependencies = [
-            "toml>=0.10.2",
             "packaging>=21.0",
             "virtualenv>=20.0.0",
             "pip>=21.0.0",
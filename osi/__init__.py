@@ -9,12 +9,26 @@ __version__ = "1.0.0"
 __author__ = "Ethan Li"
 __description__ = "Python environment management for PyWheel applications"
 
-from .config_manager import ConfigManager
-from .dependency_resolver import DependencyResolver
-from .environment_manager import EnvironmentManager
-from .launcher import Launcher
-from .pyproject_parser import PyProjectParser
-from .wheel_manager import WheelManager
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .config_manager import ConfigManager
+    from .dependency_resolver import DependencyResolver
+    from .environment_manager import EnvironmentManager
+    from .launcher import Launcher
+    from .pyproject_parser import PyProjectParser
+    from .wheel_manager import WheelManager
+
+# Public classes are imported on first access to keep CLI startup fast
+_LAZY_IMPORTS = {
+    "EnvironmentManager": ".environment_manager",
+    "DependencyResolver": ".dependency_resolver",
+    "Launcher": ".launcher",
+    "ConfigManager": ".config_manager",
+    "WheelManager": ".wheel_manager",
+    "PyProjectParser": ".pyproject_parser",
+}
 
 __all__ = [
     "EnvironmentManager",
@@ -24,3 +38,17 @@ __all__ = [
     "WheelManager",
     "PyProjectParser",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
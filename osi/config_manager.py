@@ -7,7 +7,7 @@ Tools are distributed as Python wheels with standard pyproject.toml configuratio
 
 import logging
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 
 from .pyproject_parser import PyProjectParser
 from .tool_config import ToolConfig
@@ -86,15 +86,46 @@ class ConfigManager:
             if not wheel_info:
                 return None
 
-            pyproject_config = self.pyproject_parser.parse_from_wheel(wheel_info)
-            if pyproject_config:
-                return pyproject_config.to_tool_config()
-            return None
+            return self._config_from_wheel_info(wheel_info)
 
         except Exception as e:
             self.logger.error(f"Failed to load from wheel: {e}")
             return None
 
+    def _config_from_wheel_info(self, wheel_info: WheelInfo) -> Optional[ToolConfig]:
+        """Convert already-extracted wheel metadata to a ToolConfig."""
+        pyproject_config = self.pyproject_parser.parse_from_wheel(wheel_info)
+        if pyproject_config:
+            return pyproject_config.to_tool_config()
+        return None
+
+    def iter_tool_configs(self) -> Iterator[Tuple[str, Optional[ToolConfig]]]:
+        """
+        Iterate over all available tools and their configurations.
+
+        Wheels are discovered once for the whole pass instead of once per tool.
+
+        Yields:
+            (tool name, ToolConfig or None if it could not be loaded), sorted by name
+        """
+        wheels: Dict[str, WheelInfo] = {}
+        for wheel_info in self.wheel_manager.list_available_tools():
+            # First match wins, as in find_wheel_by_name
+            wheels.setdefault(wheel_info.tool_name, wheel_info)
+
+        for tool_name in sorted(wheels):
+            config = self._config_cache.get(tool_name)
+            if config is None:
+                try:
+                    config = self._config_from_wheel_info(wheels[tool_name])
+                except Exception as e:
+                    self.logger.error(
+                        f"Failed to load configuration for {tool_name}: {e}"
+                    )
+                if config is not None:
+                    self._config_cache[tool_name] = config
+            yield tool_name, config
+
     def list_tools(self) -> List[str]:
         """
         List all available wheel-based tools.
@@ -139,25 +170,35 @@ class ConfigManager:
                 return False
 
             # Load and validate configuration
-            config = self.load_tool_config(tool_name)
-            if not config:
-                self.logger.error(f"Failed to load configuration for {tool_name}")
-                return False
-
-            # Check that at least one entry point is specified
-            if not any(
-                [config.entry_point, config.module, config.script, config.command]
-            ):
-                self.logger.error(f"Tool {tool_name} has no entry point specified")
-                return False
-
-            self.logger.info(f"Configuration for {tool_name} is valid")
-            return True
+            return self.check_tool_config(tool_name, self.load_tool_config(tool_name))
 
         except Exception as e:
             self.logger.error(f"Failed to validate configuration for {tool_name}: {e}")
             return False
 
+    def check_tool_config(self, tool_name: str, config: Optional[ToolConfig]) -> bool:
+        """
+        Validate an already-loaded tool configuration.
+
+        Args:
+            tool_name: Name of the tool
+            config: Loaded configuration, or None if loading failed
+
+        Returns:
+            True if configuration is valid, False otherwise
+        """
+        if not config:
+            self.logger.error(f"Failed to load configuration for {tool_name}")
+            return False
+
+        # Check that at least one entry point is specified
+        if not any([config.entry_point, config.module, config.script, config.command]):
+            self.logger.error(f"Tool {tool_name} has no entry point specified")
+            return False
+
+        self.logger.info(f"Configuration for {tool_name} is valid")
+        return True
+
     def get_tool_dependencies(self, tool_name: str) -> List[str]:
         """
         Get all dependencies for a wheel-based tool.
@@ -196,10 +237,15 @@ class ConfigManager:
             self.logger.error(f"Failed to get dependencies for {tool_name}: {e}")
             return []
 
-    def clear_cache(self) -> None:
-        """Clear the configuration cache."""
+    def clear_cache(self, persistent: bool = False) -> None:
+        """
+        Clear the configuration cache.
+
+        Args:
+            persistent: Whether to also remove caches kept on disk
+        """
         self._config_cache.clear()
-        self.wheel_manager.clear_cache()
+        self.wheel_manager.clear_cache(persistent=persistent)
         self.logger.info("Configuration cache cleared")
 
     def is_wheel_based_tool(self, tool_name: str) -> bool:
@@ -279,8 +325,9 @@ class ConfigManager:
                 self.logger.info(
                     f"Successfully installed kit {kit_name} with {len(wheel_files)} tools"
                 )
-                # Clear cache to pick up new tools
-                self.clear_cache()
+                # The wheel manager already dropped the kit's discovery
+                # results, so only the configurations need to be rebuilt
+                self._config_cache.clear()
 
             return success
 
@@ -5,26 +5,81 @@ Handles creation, management, and validation of isolated Python environments
 for each tool to prevent dependency conflicts.
 """
 
+import json
 import logging
 import os
+import re
 import shutil
 import subprocess
 import sys
-import venv
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Mapping, Optional, Set, Tuple
 
-from packaging import version
+# Optional dependency handling
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
 
 from .utils import (
     ensure_directory,
+    get_cache_dir,
     get_environments_dir,
-    get_python_executable,
     is_windows,
     run_command,
     sanitize_name,
 )
 
+# Template environment cloned for new tools; hidden from list_environments
+SEED_NAME = ".seed"
+
+# Platform-dependent virtual environment layout, fixed for the process
+_IS_WINDOWS = is_windows()
+_BIN = "Scripts" if _IS_WINDOWS else "bin"
+_PY_EXE = "python.exe" if _IS_WINDOWS else "python"
+_PIP_EXE = "pip.exe" if _IS_WINDOWS else "pip"
+
+# Splits a requirement string at the end of its project name
+_SPEC_SPLIT = re.compile(r"[<>=!~;\[\s]")
+
+
+def _fast_rmtree(path: Path, max_workers: int = 16) -> None:
+    """
+    Remove a directory tree, unlinking files from a thread pool.
+
+    Environments contain thousands of small files, and unlink calls release
+    the GIL, so overlapping them is much faster than shutil.rmtree.
+
+    Args:
+        path: Directory to remove
+        max_workers: Number of unlink threads
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    files: List[str] = []
+    dirs: List[str] = []
+    stack = [str(path)]
+    while stack:
+        current = stack.pop()
+        dirs.append(current)
+        with os.scandir(current) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                else:
+                    files.append(entry.path)
+
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(os.unlink, files))
+
+        # Every directory is listed after its parent, so reverse is post-order
+        for directory in reversed(dirs):
+            os.rmdir(directory)
+    except OSError:
+        # Let shutil finish the job and raise a meaningful error if it can't
+        shutil.rmtree(path)
+
 
 class EnvironmentManager:
     """
@@ -36,6 +91,12 @@ class EnvironmentManager:
 
     def __init__(self) -> None:
         self.environments_dir = get_environments_dir()
+        self.cache_dir = get_cache_dir()
+        self.seed_dir = self.environments_dir / SEED_NAME
+        self._exists_cache: Set[str] = set()
+        self._env_paths: Dict[str, Path] = {}
+        # Per-tool run environments derived from os.environ, built on first use
+        self._env_templates: Dict[str, Dict[str, str]] = {}
         self.logger = logging.getLogger(__name__)
         ensure_directory(self.environments_dir)
 
@@ -49,8 +110,11 @@ class EnvironmentManager:
         Returns:
             Path to the environment directory
         """
-        sanitized_name = sanitize_name(tool_name)
-        return self.environments_dir / sanitized_name
+        env_path = self._env_paths.get(tool_name)
+        if env_path is None:
+            env_path = self.environments_dir / sanitize_name(tool_name)
+            self._env_paths[tool_name] = env_path
+        return env_path
 
     def get_environment_python(self, tool_name: str) -> Path:
         """
@@ -62,12 +126,7 @@ class EnvironmentManager:
         Returns:
             Path to the Python executable
         """
-        env_path = self.get_environment_path(tool_name)
-
-        if is_windows():
-            return env_path / "Scripts" / "python.exe"
-        else:
-            return env_path / "bin" / "python"
+        return self.get_environment_path(tool_name) / _BIN / _PY_EXE
 
     def get_environment_pip(self, tool_name: str) -> Path:
         """
@@ -79,12 +138,23 @@ class EnvironmentManager:
         Returns:
             Path to the pip executable
         """
-        env_path = self.get_environment_path(tool_name)
+        return self.get_environment_path(tool_name) / _BIN / _PIP_EXE
 
-        if is_windows():
-            return env_path / "Scripts" / "pip.exe"
-        else:
-            return env_path / "bin" / "pip"
+    def _pip_env(self) -> Dict[str, str]:
+        """Environment for pip invocations, pointing at the shared pip cache."""
+        env = os.environ.copy()
+        env["PIP_CACHE_DIR"] = str(self.cache_dir / "pip")
+        return env
+
+    def _run_pip(self, tool_name: str, args: List[str]) -> None:
+        """
+        Run a pip command in a tool's environment.
+
+        Raises:
+            subprocess.CalledProcessError: If pip fails
+        """
+        pip_path = self.get_environment_pip(tool_name)
+        run_command([str(pip_path), *args], env=self._pip_env())
 
     def environment_exists(self, tool_name: str) -> bool:
         """
@@ -96,13 +166,21 @@ class EnvironmentManager:
         Returns:
             True if environment exists, False otherwise
         """
-        env_path = self.get_environment_path(tool_name)
-        python_path = self.get_environment_python(tool_name)
+        if tool_name in self._exists_cache:
+            return True
 
-        return env_path.exists() and python_path.exists()
+        # The interpreter lives inside the environment, so one stat covers both
+        if self.get_environment_python(tool_name).exists():
+            self._exists_cache.add(tool_name)
+            return True
+
+        return False
 
     def create_environment(
-        self, tool_name: str, python_version: Optional[str] = None
+        self,
+        tool_name: str,
+        python_version: Optional[str] = None,
+        upgrade_pip: bool = False,
     ) -> bool:
         """
         Create a new virtual environment for a tool.
@@ -110,10 +188,15 @@ class EnvironmentManager:
         Args:
             tool_name: Name of the tool
             python_version: Specific Python version to use (optional)
+            upgrade_pip: Whether to upgrade the bundled pip after creation
 
         Returns:
             True if successful, False otherwise
         """
+        import venv
+
+        self._exists_cache.discard(tool_name)
+
         try:
             env_path = self.get_environment_path(tool_name)
 
@@ -124,13 +207,15 @@ class EnvironmentManager:
                 self.logger.info(f"Removing existing environment for {tool_name}")
                 self.remove_environment(tool_name)
 
-            # Create the environment
-            venv.create(env_path, with_pip=True, clear=True)
+            # Clone the seed environment, falling back to a fresh venv
+            if not self._clone_seed_environment(env_path):
+                venv.create(env_path, with_pip=True, clear=True)
 
-            # Upgrade pip to latest version
-            self.logger.info(f"Upgrading pip in {tool_name} environment")
-            pip_path = self.get_environment_pip(tool_name)
-            run_command([str(pip_path), "install", "--upgrade", "pip"])
+            # The bundled pip is usually recent enough, so upgrading is opt-in
+            if upgrade_pip:
+                self.logger.info(f"Upgrading pip in {tool_name} environment")
+                pip_path = self.get_environment_pip(tool_name)
+                run_command([str(pip_path), "install", "--upgrade", "pip"])
 
             self.logger.info(f"Successfully created environment for {tool_name}")
             return True
@@ -139,6 +224,90 @@ class EnvironmentManager:
             self.logger.error(f"Failed to create environment for {tool_name}: {e}")
             return False
 
+    def _seed_is_current(self) -> bool:
+        """Check that the seed environment matches the running interpreter."""
+        try:
+            cfg = (self.seed_dir / "pyvenv.cfg").read_text(encoding="utf-8")
+        except OSError:
+            return False
+
+        expected = "version = {}.{}.{}".format(*sys.version_info[:3])
+        return (
+            expected in cfg.splitlines() and (self.seed_dir / _BIN / _PY_EXE).exists()
+        )
+
+    def _ensure_seed_environment(self) -> bool:
+        """Build the seed environment with pip if missing or stale."""
+        import venv
+
+        if self._seed_is_current():
+            return True
+
+        try:
+            self.logger.info(f"Building seed environment at {self.seed_dir}")
+            if self.seed_dir.exists():
+                _fast_rmtree(self.seed_dir)
+            venv.create(self.seed_dir, with_pip=True, clear=True)
+            return True
+
+        except Exception as e:
+            self.logger.warning(f"Failed to build seed environment: {e}")
+            return False
+
+    def _clone_seed_environment(self, env_path: Path) -> bool:
+        """
+        Create an environment by copying the seed environment.
+
+        Files are hardlinked where possible. Scripts and pyvenv.cfg that embed
+        the seed path are rewritten as new files so the seed stays untouched.
+        Windows is not supported since its script launchers are binaries.
+
+        Args:
+            env_path: Destination environment directory
+
+        Returns:
+            True if the clone succeeded, False if the caller should fall back
+        """
+        if _IS_WINDOWS or not self._ensure_seed_environment():
+            return False
+
+        def link_or_copy(src: str, dst: str) -> None:
+            try:
+                os.link(src, dst)
+            except OSError:
+                shutil.copy2(src, dst)
+
+        try:
+            shutil.copytree(
+                self.seed_dir,
+                env_path,
+                symlinks=True,
+                copy_function=link_or_copy,
+            )
+
+            old_prefix = str(self.seed_dir).encode()
+            new_prefix = str(env_path).encode()
+            candidates = [env_path / "pyvenv.cfg", *(env_path / _BIN).iterdir()]
+
+            for path in candidates:
+                if path.is_symlink() or not path.is_file():
+                    continue
+                content = path.read_bytes()
+                if old_prefix not in content:
+                    continue
+                mode = path.stat().st_mode
+                path.unlink()
+                path.write_bytes(content.replace(old_prefix, new_prefix))
+                path.chmod(mode)
+
+            return True
+
+        except Exception as e:
+            self.logger.warning(f"Failed to clone seed environment: {e}")
+            if env_path.exists():
+                shutil.rmtree(env_path, ignore_errors=True)
+            return False
+
     def remove_environment(self, tool_name: str) -> bool:
         """
         Remove an environment for a tool.
@@ -149,12 +318,14 @@ class EnvironmentManager:
         Returns:
             True if successful, False otherwise
         """
+        self._exists_cache.discard(tool_name)
+
         try:
             env_path = self.get_environment_path(tool_name)
 
             if env_path.exists():
                 self.logger.info(f"Removing environment for {tool_name}")
-                shutil.rmtree(env_path)
+                _fast_rmtree(env_path)
                 self.logger.info(f"Successfully removed environment for {tool_name}")
             else:
                 self.logger.info(f"Environment for {tool_name} does not exist")
@@ -165,6 +336,26 @@ class EnvironmentManager:
             self.logger.error(f"Failed to remove environment for {tool_name}: {e}")
             return False
 
+    def clear_cache(self) -> bool:
+        """
+        Remove the seed environment and the shared pip cache.
+
+        Both are rebuilt on demand by the next environment creation or install.
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            for path in (self.seed_dir, self.cache_dir / "pip"):
+                if path.exists():
+                    self.logger.info(f"Removing {path}")
+                    _fast_rmtree(path)
+            return True
+
+        except Exception as e:
+            self.logger.error(f"Failed to clear environment caches: {e}")
+            return False
+
     def install_dependencies(self, tool_name: str, requirements: List[str]) -> bool:
         """
         Install dependencies in a tool's environment.
@@ -181,14 +372,12 @@ class EnvironmentManager:
                 self.logger.error(f"Environment for {tool_name} does not exist")
                 return False
 
-            pip_path = self.get_environment_pip(tool_name)
-
             self.logger.info(f"Installing dependencies for {tool_name}: {requirements}")
 
             # Install each requirement
             for requirement in requirements:
                 self.logger.info(f"Installing {requirement}")
-                run_command([str(pip_path), "install", requirement])
+                self._run_pip(tool_name, ["install", requirement])
 
             self.logger.info(f"Successfully installed dependencies for {tool_name}")
             return True
@@ -222,7 +411,15 @@ class EnvironmentManager:
             pip_path = self.get_environment_pip(tool_name)
 
             self.logger.info(f"Installing dependencies from {requirements_file}")
-            run_command([str(pip_path), "install", "-r", str(requirements_file)])
+            run_command(
+                [
+                    str(pip_path),
+                    "install",
+                    "-r",
+                    str(requirements_file),
+                ],
+                env=self._pip_env(),
+            )
 
             self.logger.info(
                 f"Successfully installed dependencies from {requirements_file}"
@@ -249,22 +446,21 @@ class EnvironmentManager:
                 return {}
 
             pip_path = self.get_environment_pip(tool_name)
-            result = run_command([str(pip_path), "list", "--format=freeze"])
-
-            packages = {}
-            for line in result.stdout.strip().split("\n"):
-                if "==" in line:
-                    name, version_str = line.split("==", 1)
-                    packages[name] = version_str
+            result = run_command([str(pip_path), "list", "--format=json"])
 
-            return packages
+            # JSON output also covers editable and direct-URL installs
+            loads = orjson.loads if orjson else json.loads
+            return {pkg["name"]: pkg["version"] for pkg in loads(result.stdout)}
 
         except Exception as e:
             self.logger.error(f"Failed to get installed packages for {tool_name}: {e}")
             return {}
 
     def validate_environment(
-        self, tool_name: str, required_packages: Optional[List[str]] = None
+        self,
+        tool_name: str,
+        required_packages: Optional[List[str]] = None,
+        deep: bool = False,
     ) -> bool:
         """
         Validate that an environment exists and has required packages.
@@ -272,6 +468,7 @@ class EnvironmentManager:
         Args:
             tool_name: Name of the tool
             required_packages: List of required packages (optional)
+            deep: Also run the interpreter to confirm it starts
 
         Returns:
             True if environment is valid, False otherwise
@@ -282,29 +479,46 @@ class EnvironmentManager:
                 self.logger.warning(f"Environment for {tool_name} does not exist")
                 return False
 
-            # Check if Python executable works
+            # Check the interpreter and venv marker without spawning a process
             python_path = self.get_environment_python(tool_name)
-            try:
-                run_command([str(python_path), "--version"], timeout=10)
-            except Exception as e:
+            env_path = self.get_environment_path(tool_name)
+            if not (
+                python_path.is_file()
+                and os.access(python_path, os.X_OK)
+                and (env_path / "pyvenv.cfg").is_file()
+            ):
                 self.logger.error(
-                    f"Python executable not working in {tool_name} environment: {e}"
+                    f"Python executable not usable in {tool_name} environment"
                 )
                 return False
 
+            if deep:
+                try:
+                    run_command([str(python_path), "--version"], timeout=10)
+                except Exception as e:
+                    self.logger.error(
+                        f"Python executable not working in {tool_name} environment: {e}"
+                    )
+                    return False
+
             # Check required packages if specified
             if required_packages:
-                installed_packages = self.get_installed_packages(tool_name)
-                for package in required_packages:
-                    # Simple package name check (could be enhanced for version checking)
-                    package_name = (
-                        package.split(">=")[0].split("==")[0].split("<")[0].strip()
+                from packaging.utils import canonicalize_name
+
+                installed = {
+                    canonicalize_name(name)
+                    for name in self.get_installed_packages(tool_name)
+                }
+                # Name-only check (could be enhanced for version checking)
+                missing = {
+                    canonicalize_name(_SPEC_SPLIT.split(package, 1)[0].strip())
+                    for package in required_packages
+                } - installed
+                if missing:
+                    self.logger.warning(
+                        f"Required packages {sorted(missing)} not found in {tool_name} environment"
                     )
-                    if package_name not in installed_packages:
-                        self.logger.warning(
-                            f"Required package {package_name} not found in {tool_name} environment"
-                        )
-                        return False
+                    return False
 
             self.logger.info(f"Environment for {tool_name} is valid")
             return True
@@ -324,12 +538,19 @@ class EnvironmentManager:
             if not self.environments_dir.exists():
                 return []
 
+            python_suffix = os.sep + os.path.join(_BIN, _PY_EXE)
+
             environments = []
-            for item in self.environments_dir.iterdir():
-                if item.is_dir():
-                    # Check if it's a valid environment
-                    if self.environment_exists(item.name):
-                        environments.append(item.name)
+            with os.scandir(self.environments_dir) as entries:
+                for entry in entries:
+                    # d_type from the directory listing, no extra stat needed
+                    if entry.name.startswith(".") or not entry.is_dir(
+                        follow_symlinks=False
+                    ):
+                        continue
+                    # A valid environment has an interpreter; one lstat per candidate
+                    if os.path.lexists(entry.path + python_suffix):
+                        environments.append(entry.name)
 
             return sorted(environments)
 
@@ -337,6 +558,30 @@ class EnvironmentManager:
             self.logger.error(f"Failed to list environments: {e}")
             return []
 
+    def _build_tool_env(
+        self, tool_name: str, base_env: Mapping[str, str]
+    ) -> Dict[str, str]:
+        """
+        Build the process environment for running inside a tool's venv.
+
+        Args:
+            tool_name: Name of the tool
+            base_env: Environment variables to start from (not modified)
+
+        Returns:
+            New environment dictionary
+        """
+        env_path = self.get_environment_path(tool_name)
+
+        env = dict(base_env)
+        env["PATH"] = f"{env_path / _BIN}{os.pathsep}{env.get('PATH', '')}"
+
+        # Set virtual environment variables
+        env["VIRTUAL_ENV"] = str(env_path)
+        env.pop("PYTHONHOME", None)  # Remove PYTHONHOME if set
+
+        return env
+
     def run_in_environment(
         self, tool_name: str, command: List[str], **kwargs: Any
     ) -> subprocess.CompletedProcess:
@@ -359,27 +604,28 @@ class EnvironmentManager:
             raise RuntimeError(f"Environment for {tool_name} does not exist")
 
         python_path = self.get_environment_python(tool_name)
-        env_path = self.get_environment_path(tool_name)
 
         # Set up environment variables to use the virtual environment
-        env = kwargs.get("env", os.environ.copy())
-
-        if is_windows():
-            scripts_dir = env_path / "Scripts"
-            env["PATH"] = f"{scripts_dir}{os.pathsep}{env.get('PATH', '')}"
+        if "env" in kwargs:
+            env = self._build_tool_env(tool_name, kwargs["env"])
         else:
-            bin_dir = env_path / "bin"
-            env["PATH"] = f"{bin_dir}{os.pathsep}{env.get('PATH', '')}"
-
-        # Set virtual environment variables
-        env["VIRTUAL_ENV"] = str(env_path)
-        env.pop("PYTHONHOME", None)  # Remove PYTHONHOME if set
+            template = self._env_templates.get(tool_name)
+            if template is None:
+                template = self._build_tool_env(tool_name, os.environ)
+                self._env_templates[tool_name] = template
+            env = template
 
         kwargs["env"] = env
 
         # If the command starts with 'python', replace it with the environment's python
         if command and command[0] in ["python", "python3"]:
             command[0] = str(python_path)
+        elif command and not os.path.dirname(command[0]):
+            # Resolve bare names (entry points) against the environment PATH;
+            # CreateProcess on Windows searches the parent's PATH, not env's
+            resolved = shutil.which(command[0], path=env["PATH"])
+            if resolved:
+                command[0] = resolved
 
         return run_command(command, **kwargs)
 
@@ -406,7 +652,10 @@ class EnvironmentManager:
             pip_path = self.get_environment_pip(tool_name)
 
             self.logger.info(f"Installing wheel {wheel_path.name} for {tool_name}")
-            run_command([str(pip_path), "install", str(wheel_path)])
+            run_command(
+                [str(pip_path), "install", str(wheel_path)],
+                env=self._pip_env(),
+            )
 
             self.logger.info(f"Successfully installed wheel for {tool_name}")
             return True
@@ -416,15 +665,24 @@ class EnvironmentManager:
             return False
 
     def install_wheel_with_dependencies(
-        self, tool_name: str, wheel_path: Path, dependencies: Optional[List[str]] = None
+        self,
+        tool_name: str,
+        wheel_path: Path,
+        dependencies: Optional[List[str]] = None,
+        strict_order: bool = False,
     ) -> bool:
         """
         Install a wheel file and its dependencies into a tool's environment.
 
+        By default the wheel and its dependencies go to pip in a single call,
+        so the resolver sees everything at once.
+
         Args:
             tool_name: Name of the tool
             wheel_path: Path to the wheel file
             dependencies: Additional dependencies to install
+            strict_order: Install the dependencies in one pip call before
+                installing the wheel in a second one
 
         Returns:
             True if successful, False otherwise
@@ -434,16 +692,32 @@ class EnvironmentManager:
                 if not self.create_environment(tool_name):
                     return False
 
-            # Install dependencies first if provided
-            if dependencies:
-                if not self.install_dependencies(tool_name, dependencies):
-                    self.logger.error(f"Failed to install dependencies for {tool_name}")
-                    return False
-
-            # Install the wheel
-            if not self.install_wheel(tool_name, wheel_path):
+            if not wheel_path.exists():
+                self.logger.error(f"Wheel file not found: {wheel_path}")
                 return False
 
+            if strict_order:
+                if dependencies:
+                    self.logger.info(f"Installing {dependencies} for {tool_name}")
+                    self._run_pip(tool_name, ["install", *dependencies])
+                self.logger.info(f"Installing wheel {wheel_path.name} for {tool_name}")
+                self._run_pip(tool_name, ["install", str(wheel_path)])
+            else:
+                pip_path = self.get_environment_pip(tool_name)
+
+                self.logger.info(
+                    f"Installing wheel {wheel_path.name} with dependencies for {tool_name}"
+                )
+                run_command(
+                    [
+                        str(pip_path),
+                        "install",
+                        str(wheel_path),
+                        *(dependencies or []),
+                    ],
+                    env=self._pip_env(),
+                )
+
             self.logger.info(
                 f"Successfully installed wheel and dependencies for {tool_name}"
             )
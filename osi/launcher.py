@@ -9,14 +9,36 @@ import argparse
 import logging
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Any, List, Optional
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    FrozenSet,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
 
 from . import __version__
-from .config_manager import ConfigManager
-from .dependency_resolver import DependencyResolver
-from .environment_manager import EnvironmentManager
-from .utils import get_platform_info, setup_logging, validate_python_version
+from .utils import (
+    get_platform_info,
+    sanitize_name,
+    setup_logging,
+    validate_python_version,
+)
+
+if TYPE_CHECKING:
+    from .config_manager import ConfigManager
+    from .dependency_resolver import DependencyResolver
+    from .environment_manager import EnvironmentManager
+    from .tool_config import ToolConfig
+    from .wheel_manager import WheelInfo
+
+_T = TypeVar("_T")
 
 
 class Launcher:
@@ -28,10 +50,80 @@ class Launcher:
     """
 
     def __init__(self) -> None:
-        self.config_manager = ConfigManager()
-        self.env_manager = EnvironmentManager()
-        self.dependency_resolver = DependencyResolver()
         self.logger = logging.getLogger(__name__)
+        # Per-command lookups; cleared whenever tools are installed or removed
+        self._wheel_info = lru_cache(maxsize=None)(self._lookup_wheel_info)
+        self._tool_config = lru_cache(maxsize=None)(self._lookup_tool_config)
+
+    # Managers are created on first use so commands only import what they need
+
+    @cached_property
+    def config_manager(self) -> "ConfigManager":
+        """Tool and kit configuration manager."""
+        from .config_manager import ConfigManager
+
+        return ConfigManager()
+
+    @cached_property
+    def env_manager(self) -> "EnvironmentManager":
+        """Tool environment manager."""
+        from .environment_manager import EnvironmentManager
+
+        return EnvironmentManager()
+
+    @cached_property
+    def dependency_resolver(self) -> "DependencyResolver":
+        """Dependency resolver."""
+        from .dependency_resolver import DependencyResolver
+
+        return DependencyResolver()
+
+    @staticmethod
+    def _write_lines(lines: List[str]) -> None:
+        """Write a report to stdout in a single call."""
+        if lines:
+            sys.stdout.write("\n".join(lines) + "\n")
+
+    def _lookup_wheel_info(self, tool_name: str) -> Optional["WheelInfo"]:
+        """Find the wheel for a tool (memoized as _wheel_info)."""
+        return self.config_manager.get_wheel_info(tool_name)
+
+    def _lookup_tool_config(self, tool_name: str) -> Optional["ToolConfig"]:
+        """Load a tool's configuration (memoized as _tool_config)."""
+        return self.config_manager.load_tool_config(tool_name)
+
+    def _invalidate_tool_caches(self) -> None:
+        """Forget memoized wheel and configuration lookups."""
+        self._wheel_info.cache_clear()
+        self._tool_config.cache_clear()
+
+    def _map_tools(self, func: Callable[[str], _T], tools: List[str]) -> List[_T]:
+        """
+        Apply an I/O-bound function to each tool concurrently.
+
+        Args:
+            func: Function taking a tool name
+            tools: Tool names
+
+        Returns:
+            Results in the same order as tools
+        """
+        if len(tools) <= 1:
+            return [func(tool_name) for tool_name in tools]
+
+        with ThreadPoolExecutor(max_workers=min(32, len(tools))) as executor:
+            return list(executor.map(func, tools))
+
+    def _installed_environments(self) -> FrozenSet[str]:
+        """Get the names of all installed environments with a single scan."""
+        return frozenset(self.env_manager.list_environments())
+
+    def _probe_tool(
+        self, tool_name: str, installed: FrozenSet[str]
+    ) -> Tuple[str, Optional["ToolConfig"], bool]:
+        """Load a tool's configuration and check whether it is installed."""
+        config = self._tool_config(tool_name)
+        return tool_name, config, sanitize_name(tool_name) in installed
 
     def list_tools(self) -> None:
         """List all available tools."""
@@ -41,18 +133,20 @@ class Launcher:
             print("No tools available.")
             return
 
-        print("Available tools:")
-        print("-" * 50)
+        lines = ["Available tools:"]
+        lines.append("-" * 50)
 
-        for tool_name in tools:
-            config = self.config_manager.load_tool_config(tool_name)
+        installed = self._installed_environments()
+        for tool_name, config, env_exists in self._map_tools(
+            lambda tool_name: self._probe_tool(tool_name, installed), tools
+        ):
             if config:
-                status = (
-                    "[OK]" if self.env_manager.environment_exists(tool_name) else "[!]"
-                )
-                print(f"{status} {tool_name:<20} - {config.description}")
+                status = "[OK]" if env_exists else "[!]"
+                lines.append(f"{status} {tool_name:<20} - {config.description}")
             else:
-                print(f"[!] {tool_name:<20} - (configuration error)")
+                lines.append(f"[!] {tool_name:<20} - (configuration error)")
+
+        self._write_lines(lines)
 
     def install_tool(self, tool_name: str) -> bool:
         """
@@ -68,20 +162,15 @@ class Launcher:
             print(f"Installing wheel-based tool: {tool_name}")
 
             # Check if tool exists
-            if not self.config_manager.tool_exists(tool_name):
-                print(f"Error: Tool '{tool_name}' not found.")
-                return False
-
-            # Get wheel info
-            wheel_info = self.config_manager.get_wheel_info(tool_name)
+            wheel_info = self._wheel_info(tool_name)
             if not wheel_info:
-                print(f"Error: No wheel found for tool '{tool_name}'.")
+                print(f"Error: Tool '{tool_name}' not found.")
                 return False
 
             return self._install_wheel_based_tool(tool_name, wheel_info)
 
         except Exception as e:
-            self.logger.error(f"Failed to install tool {tool_name}: {e}")
+            self.logger.error("Failed to install tool %s: %s", tool_name, e)
             print(
                 f"Error: Failed to install tool '{tool_name}'. Check logs for details."
             )
@@ -109,9 +198,12 @@ class Launcher:
                 return False
 
         except Exception as e:
-            self.logger.error(f"Failed to install wheel-based tool {tool_name}: {e}")
+            self.logger.error("Failed to install wheel-based tool %s: %s", tool_name, e)
             return False
 
+        finally:
+            self._invalidate_tool_caches()
+
     def run_tool(self, tool_name: str, args: Optional[List[str]] = None) -> int:
         """
         Run a tool with the given arguments.
@@ -130,12 +222,12 @@ class Launcher:
             print(f"Running tool: {tool_name}")
 
             # Check if tool exists
-            if not self.config_manager.tool_exists(tool_name):
+            if not self._wheel_info(tool_name):
                 print(f"Error: Tool '{tool_name}' not found.")
                 return 1
 
             # Load configuration
-            config = self.config_manager.load_tool_config(tool_name)
+            config = self._tool_config(tool_name)
             if not config:
                 print(f"Error: Failed to load configuration for '{tool_name}'.")
                 return 1
@@ -162,7 +254,7 @@ class Launcher:
             return result.returncode
 
         except Exception as e:
-            self.logger.error(f"Failed to run tool {tool_name}: {e}")
+            self.logger.error("Failed to run tool %s: %s", tool_name, e)
             print(f"Error: Failed to run tool '{tool_name}'. Check logs for details.")
             return 1
 
@@ -178,11 +270,11 @@ class Launcher:
             Command list or None if no valid entry point
         """
         # Get wheel info for the tool
-        wheel_info = self.config_manager.get_wheel_info(config.name)
+        wheel_info = self._wheel_info(config.name)
 
         if wheel_info and wheel_info.entry_points:
             # Use entry point from wheel
-            entry_point_name = list(wheel_info.entry_points.keys())[0]
+            entry_point_name = next(iter(wheel_info.entry_points))
             return [entry_point_name] + args
 
         # Fallback to config entry point if available
@@ -190,7 +282,7 @@ class Launcher:
             return [config.entry_point] + args
 
         # If no entry point found, this shouldn't happen for valid wheels
-        self.logger.error(f"No entry point found for wheel-based tool {config.name}")
+        self.logger.error("No entry point found for wheel-based tool %s", config.name)
         return None
 
     def uninstall_tool(self, tool_name: str) -> bool:
@@ -218,12 +310,15 @@ class Launcher:
                 return False
 
         except Exception as e:
-            self.logger.error(f"Failed to uninstall tool {tool_name}: {e}")
+            self.logger.error("Failed to uninstall tool %s: %s", tool_name, e)
             print(
                 f"Error: Failed to uninstall tool '{tool_name}'. Check logs for details."
             )
             return False
 
+        finally:
+            self._invalidate_tool_caches()
+
     def show_tool_info(self, tool_name: str) -> None:
         """
         Show detailed information about a tool.
@@ -231,107 +326,139 @@ class Launcher:
         Args:
             tool_name: Name of the tool
         """
+        lines: List[str] = []
         try:
-            if not self.config_manager.tool_exists(tool_name):
+            if not self._wheel_info(tool_name):
                 print(f"Error: Tool '{tool_name}' not found.")
                 return
 
-            config = self.config_manager.load_tool_config(tool_name)
+            config = self._tool_config(tool_name)
             if not config:
                 print(f"Error: Failed to load configuration for '{tool_name}'.")
                 return
 
             # Basic info
-            print(f"Tool: {config.name}")
-            print(f"Version: {config.version}")
-            print(f"Description: {config.description}")
-            print(f"Author: {config.author}")
-            print(f"License: {config.license}")
-            print()
+            lines.append(f"Tool: {config.name}")
+            lines.append(f"Version: {config.version}")
+            lines.append(f"Description: {config.description}")
+            lines.append(f"Author: {config.author}")
+            lines.append(f"License: {config.license}")
+            lines.append("")
 
             # Environment status
             env_exists = self.env_manager.environment_exists(tool_name)
-            print(f"Environment: {'Installed' if env_exists else 'Not installed'}")
+            lines.append(
+                f"Environment: {'Installed' if env_exists else 'Not installed'}"
+            )
 
             if env_exists:
                 deps_satisfied = self.dependency_resolver.check_dependencies_satisfied(
                     tool_name
                 )
-                print(
+                lines.append(
                     f"Dependencies: {'Satisfied' if deps_satisfied else 'Missing/Outdated'}"
                 )
 
-            print()
+            lines.append("")
 
             # Dependencies
             deps_info = self.dependency_resolver.get_dependency_info(tool_name)
-            print("Dependencies:")
+            lines.append("Dependencies:")
             required_deps = deps_info.get("required", [])
             missing_deps = deps_info.get("missing", [])
 
             if required_deps and isinstance(required_deps, list):
+                missing_set = (
+                    set(missing_deps) if isinstance(missing_deps, list) else None
+                )
                 for dep in required_deps:
                     status = (
                         "[OK]"
-                        if isinstance(missing_deps, list) and dep not in missing_deps
+                        if missing_set is not None and dep not in missing_set
                         else "[!]"
                     )
-                    print(f"  {status} {dep}")
+                    lines.append(f"  {status} {dep}")
             else:
-                print("  None")
+                lines.append("  None")
+
+            self._write_lines(lines)
 
         except Exception as e:
-            self.logger.error(f"Failed to show info for tool {tool_name}: {e}")
+            self.logger.error("Failed to show info for tool %s: %s", tool_name, e)
+            self._write_lines(lines)
             print(
                 f"Error: Failed to get information for '{tool_name}'. Check logs for details."
             )
 
     def doctor(self) -> None:
         """Run diagnostic checks on the OSI system."""
-        print("OSI System Diagnostics")
-        print("=" * 50)
+        lines = ["OSI System Diagnostics"]
+        lines.append("=" * 50)
 
         # Python version check
         if validate_python_version():
-            print("[OK] Python version is compatible")
+            lines.append("[OK] Python version is compatible")
         else:
-            print("[!] Python version is too old (requires 3.11+)")
+            lines.append("[!] Python version is too old (requires 3.11+)")
 
         # Platform info
         platform_info = get_platform_info()
-        print(f"[OK] Platform: {platform_info['system']} {platform_info['machine']}")
-        print(f"[OK] Python: {platform_info['python_version']}")
+        lines.append(
+            f"[OK] Platform: {platform_info['system']} {platform_info['machine']}"
+        )
+        lines.append(f"[OK] Python: {platform_info['python_version']}")
 
         # Check environments
         environments = self.env_manager.list_environments()
-        print(f"[OK] Found {len(environments)} tool environments")
+        lines.append(f"[OK] Found {len(environments)} tool environments")
 
-        # Check tools
-        tools = self.config_manager.list_tools()
-        print(f"[OK] Found {len(tools)} configured tools")
+        # Check tools in a single pass over the discovered wheels
+        results = [
+            (tool_name, self.config_manager.check_tool_config(tool_name, config))
+            for tool_name, config in self.config_manager.iter_tool_configs()
+        ]
+        lines.append(f"[OK] Found {len(results)} configured tools")
 
         # Check for issues
         issues = 0
-        for tool_name in tools:
-            if not self.config_manager.validate_tool_config(tool_name):
-                print(f"[!] Tool '{tool_name}' has invalid configuration")
+        for tool_name, valid in results:
+            if not valid:
+                lines.append(f"[!] Tool '{tool_name}' has invalid configuration")
                 issues += 1
 
         if issues == 0:
-            print("[OK] All tool configurations are valid")
+            lines.append("[OK] All tool configurations are valid")
 
-        print(f"\nDiagnostics complete. Found {issues} issues.")
+        lines.append(f"\nDiagnostics complete. Found {issues} issues.")
+        self._write_lines(lines)
 
     def clean(self) -> None:
         """Clean up all environments and caches."""
         print("Cleaning OSI system...")
 
         environments = self.env_manager.list_environments()
-        for env_name in environments:
-            print(f"Removing environment: {env_name}")
-            self.env_manager.remove_environment(env_name)
+        if environments:
+            # Environments are independent directories; remove them concurrently
+            with ThreadPoolExecutor(max_workers=min(8, len(environments))) as executor:
+                futures = {}
+                for env_name in environments:
+                    future = executor.submit(
+                        self.env_manager.remove_environment, env_name
+                    )
+                    futures[future] = env_name
 
-        self.config_manager.clear_cache()
+                for future in as_completed(futures):
+                    env_name = futures[future]
+                    if future.result():
+                        print(f"Removed environment: {env_name}")
+                    else:
+                        print(f"Error: Failed to remove environment: {env_name}")
+
+        if not self.env_manager.clear_cache():
+            print("Error: Failed to remove environment caches")
+
+        self.config_manager.clear_cache(persistent=True)
+        self._invalidate_tool_caches()
         print("Clean complete.")
 
     def list_kits(self) -> None:
@@ -342,16 +469,18 @@ class Launcher:
             print("No kits available.")
             return
 
-        print("Available kits:")
-        print("-" * 50)
+        lines = ["Available kits:"]
+        lines.append("-" * 50)
 
         for kit_name in kits:
             tools = self.config_manager.get_kit_tools(kit_name)
-            print(f"{kit_name:<20} - {len(tools)} tools")
+            lines.append(f"{kit_name:<20} - {len(tools)} tools")
             for tool in tools[:3]:  # Show first 3 tools
-                print(f"  • {tool}")
+                lines.append(f"  • {tool}")
             if len(tools) > 3:
-                print(f"  ... and {len(tools) - 3} more")
+                lines.append(f"  ... and {len(tools) - 3} more")
+
+        self._write_lines(lines)
 
     def install_kit(self, kit_path: str) -> bool:
         """
@@ -373,6 +502,7 @@ class Launcher:
                 return False
 
             success = self.config_manager.install_kit(kit_path_obj)
+            self._invalidate_tool_caches()
 
             if success:
                 print(f"Successfully installed kit from {kit_path}")
@@ -382,7 +512,7 @@ class Launcher:
                 return False
 
         except Exception as e:
-            self.logger.error(f"Failed to install kit: {e}")
+            self.logger.error("Failed to install kit: %s", e)
             print(f"Error: Failed to install kit. Check logs for details.")
             return False
 
@@ -400,24 +530,24 @@ class Launcher:
                 print(f"Kit '{kit_name}' not found or contains no tools.")
                 return
 
-            print(f"Kit: {kit_name}")
-            print(f"Tools: {len(tools)}")
-            print("-" * 50)
+            lines = [f"Kit: {kit_name}"]
+            lines.append(f"Tools: {len(tools)}")
+            lines.append("-" * 50)
 
-            for tool_name in tools:
-                config = self.config_manager.load_tool_config(tool_name)
+            installed = self._installed_environments()
+            for tool_name, config, env_exists in self._map_tools(
+                lambda tool_name: self._probe_tool(tool_name, installed), tools
+            ):
                 if config:
-                    status = (
-                        "[OK]"
-                        if self.env_manager.environment_exists(tool_name)
-                        else "[!]"
-                    )
-                    print(f"{status} {tool_name:<20} - {config.description}")
+                    status = "[OK]" if env_exists else "[!]"
+                    lines.append(f"{status} {tool_name:<20} - {config.description}")
                 else:
-                    print(f"[!] {tool_name:<20} - (configuration error)")
+                    lines.append(f"[!] {tool_name:<20} - (configuration error)")
+
+            self._write_lines(lines)
 
         except Exception as e:
-            self.logger.error(f"Failed to show kit info: {e}")
+            self.logger.error("Failed to show kit info: %s", e)
             print(f"Error: Failed to get kit information. Check logs for details.")
 
 
@@ -503,6 +633,67 @@ Examples:
     return parser
 
 
+# Positional argument names for each command, used by the fast dispatcher
+_COMMAND_POSITIONALS = {
+    "list": (),
+    "install": ("tool",),
+    "run": ("tool",),
+    "uninstall": ("tool",),
+    "info": ("tool",),
+    "doctor": (),
+    "clean": (),
+    "list-kits": (),
+    "install-kit": ("kit_path",),
+    "kit-info": ("kit",),
+}
+
+
+def _fast_parse_args(argv: List[str]) -> Optional[argparse.Namespace]:
+    """
+    Parse plain command lines without building the full argparse parser.
+
+    Only handles a known command followed by its positional arguments with no
+    options; anything else (help, flags, errors) returns None so that the
+    regular parser can handle it.
+
+    Args:
+        argv: Command line arguments without the program name
+
+    Returns:
+        Parsed arguments, or None if the full parser is needed
+    """
+    if not argv or any(arg.startswith("-") for arg in argv):
+        return None
+
+    command, rest = argv[0], argv[1:]
+    positionals = _COMMAND_POSITIONALS.get(command)
+    if positionals is None:
+        return None
+
+    if command == "run":
+        if not rest:
+            return None
+        return argparse.Namespace(
+            verbose=False,
+            log_level="INFO",
+            licenses=False,
+            command=command,
+            tool=rest[0],
+            args=rest[1:],
+        )
+
+    if len(rest) != len(positionals):
+        return None
+
+    return argparse.Namespace(
+        verbose=False,
+        log_level="INFO",
+        licenses=False,
+        command=command,
+        **dict(zip(positionals, rest)),
+    )
+
+
 def show_licenses() -> int:
     """Display third-party license information."""
     import sys
@@ -570,9 +761,12 @@ def main(argv: Optional[List[str]] = None) -> int:
         Exit code
     """
     try:
-        # Parse arguments
-        parser = create_parser()
-        args = parser.parse_args(argv)
+        # Parse arguments, building the full parser only when needed
+        if argv is None:
+            argv = sys.argv[1:]
+        args = _fast_parse_args(argv)
+        if args is None:
+            args = create_parser().parse_args(argv)
 
         # Handle license display
         if hasattr(args, "licenses") and args.licenses:
@@ -627,7 +821,7 @@ def main(argv: Optional[List[str]] = None) -> int:
 
         else:
             # No command specified, show help
-            parser.print_help()
+            create_parser().print_help()
             return 0
 
     except KeyboardInterrupt:
@@ -6,17 +6,34 @@ and configuration for OSI tool management.
 """
 
 import logging
+import tomllib
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
-
-import toml
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from .tool_config import ToolConfig
 from .wheel_manager import WheelInfo
 
-
-@dataclass
+# [project] keys copied as-is: (TOML key, PyProjectConfig field, default factory)
+_PROJECT_FIELDS: Tuple[Tuple[str, str, Callable[[], Any]], ...] = (
+    ("description", "description", str),
+    ("readme", "readme", str),
+    ("keywords", "keywords", list),
+    ("classifiers", "classifiers", list),
+    ("requires-python", "python_requires", lambda: ">=3.11"),
+    ("dependencies", "dependencies", list),
+    ("optional-dependencies", "optional_dependencies", dict),
+)
+
+# [project.urls] keys in order of preference for each PyProjectConfig field
+_URL_FIELDS: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("homepage", ("Homepage",)),
+    ("repository", ("Repository", "Source")),
+    ("documentation", ("Documentation",)),
+)
+
+
+@dataclass(slots=True)
 class PyProjectConfig:
     """
     Configuration extracted from pyproject.toml file.
@@ -58,7 +75,7 @@ class PyProjectConfig:
         # Check for console scripts first
         if self.console_scripts:
             # Use the first console script as the entry point
-            entry_point = list(self.console_scripts.keys())[0]
+            entry_point = next(iter(self.console_scripts))
 
         # Check OSI-specific configuration for other entry point types
         if self.osi_config:
@@ -105,6 +122,21 @@ class PyProjectConfig:
             post_install_commands=install_config.get("post_install", []),
         )
 
+    @classmethod
+    def from_wheel(cls, wheel_info: WheelInfo) -> "PyProjectConfig":
+        """Create a PyProjectConfig from wheel metadata."""
+        return cls(
+            name=wheel_info.name,
+            version=wheel_info.version,
+            description=wheel_info.summary or "",
+            authors=[wheel_info.author] if wheel_info.author else [],
+            license=wheel_info.license or "",
+            homepage=wheel_info.homepage or "",
+            python_requires=wheel_info.python_requires or ">=3.11",
+            dependencies=wheel_info.dependencies,
+            console_scripts=wheel_info.entry_points or {},
+        )
+
 
 class PyProjectParser:
     """
@@ -132,8 +164,8 @@ class PyProjectParser:
                 self.logger.error(f"pyproject.toml not found: {pyproject_path}")
                 return None
 
-            with open(pyproject_path, "r", encoding="utf-8") as f:
-                data = toml.load(f)
+            with open(pyproject_path, "rb") as f:
+                data = tomllib.load(f)
 
             return self.parse_data(data)
 
@@ -151,18 +183,24 @@ class PyProjectParser:
         Returns:
             PyProjectConfig object or None if parsing fails
         """
-        try:
-            # Extract project metadata
-            project = data.get("project", {})
+        # Extract project metadata
+        project = data.get("project") if isinstance(data, dict) else None
 
-            if not project:
-                self.logger.error("No [project] section found in pyproject.toml")
-                return None
+        if not project or not isinstance(project, dict):
+            self.logger.error("No [project] section found in pyproject.toml")
+            return None
 
-            name = project.get("name")
-            if not name:
-                self.logger.error("Project name is required in pyproject.toml")
-                return None
+        name = project.get("name")
+        if not name:
+            self.logger.error("Project name is required in pyproject.toml")
+            return None
+
+        try:
+            # Plain fields
+            kwargs: Dict[str, Any] = {}
+            for key, field_name, default in _PROJECT_FIELDS:
+                value = project.get(key)
+                kwargs[field_name] = default() if value is None else value
 
             # Parse version
             version = project.get("version", "1.0.0")
@@ -178,10 +216,6 @@ class PyProjectParser:
                 # Handle legacy author field
                 authors = [project["author"]]
 
-            # Parse dependencies
-            dependencies = project.get("dependencies", [])
-            optional_dependencies = project.get("optional-dependencies", {})
-
             # Parse entry points
             console_scripts = {}
             gui_scripts = {}
@@ -202,9 +236,13 @@ class PyProjectParser:
 
             # Parse URLs
             urls = project.get("urls", {})
-            homepage = urls.get("Homepage", project.get("homepage", ""))
-            repository = urls.get("Repository", urls.get("Source", ""))
-            documentation = urls.get("Documentation", "")
+            for field_name, url_keys in _URL_FIELDS:
+                kwargs[field_name] = next(
+                    (urls[key] for key in url_keys if key in urls), ""
+                )
+            if "Homepage" not in urls:
+                # Legacy top-level homepage field
+                kwargs["homepage"] = project.get("homepage", "")
 
             # Parse license
             license_info = project.get("license", {})
@@ -219,25 +257,16 @@ class PyProjectParser:
             return PyProjectConfig(
                 name=name,
                 version=str(version),
-                description=project.get("description", ""),
                 authors=authors,
                 license=license_str or "",
-                readme=project.get("readme", ""),
-                homepage=homepage,
-                repository=repository,
-                documentation=documentation,
-                keywords=project.get("keywords", []),
-                classifiers=project.get("classifiers", []),
-                python_requires=project.get("requires-python", ">=3.11"),
-                dependencies=dependencies,
-                optional_dependencies=optional_dependencies,
                 console_scripts=console_scripts,
                 gui_scripts=gui_scripts,
                 osi_config=osi_config,
+                **kwargs,
             )
 
         except Exception as e:
-            self.logger.error(f"Failed to parse pyproject.toml data: {e}")
+            self.logger.error("Failed to parse pyproject.toml data: %s", e)
             return None
 
     def parse_from_wheel(self, wheel_info: WheelInfo) -> Optional[PyProjectConfig]:
@@ -250,31 +279,15 @@ class PyProjectParser:
         Returns:
             PyProjectConfig object or None if conversion fails
         """
-        try:
-            # Convert wheel metadata to pyproject format
-            authors: List[Union[str, Dict[str, str]]] = []
-            if wheel_info.author:
-                authors = [wheel_info.author]
-
-            # Convert entry points
-            console_scripts = {}
-            if wheel_info.entry_points:
-                console_scripts = wheel_info.entry_points
+        if not wheel_info.name:
+            self.logger.error("Wheel metadata has no project name: %s", wheel_info.path)
+            return None
 
-            return PyProjectConfig(
-                name=wheel_info.name,
-                version=wheel_info.version,
-                description=wheel_info.summary or "",
-                authors=authors,
-                license=wheel_info.license or "",
-                homepage=wheel_info.homepage or "",
-                python_requires=wheel_info.python_requires or ">=3.11",
-                dependencies=wheel_info.dependencies,
-                console_scripts=console_scripts,
-            )
+        try:
+            return PyProjectConfig.from_wheel(wheel_info)
 
         except Exception as e:
-            self.logger.error(f"Failed to convert wheel info to pyproject config: {e}")
+            self.logger.error("Failed to convert wheel info to pyproject config: %s", e)
             return None
 
     def validate_config(self, config: PyProjectConfig) -> bool:
@@ -305,10 +318,10 @@ class PyProjectParser:
             )
 
             if not has_entry_point:
-                self.logger.warning(f"No entry points defined for {config.name}")
+                self.logger.warning("No entry points defined for %s", config.name)
 
             return True
 
         except Exception as e:
-            self.logger.error(f"Config validation failed: {e}")
+            self.logger.error("Config validation failed: %s", e)
             return False
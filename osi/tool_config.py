@@ -2,26 +2,34 @@
 Tool Configuration Classes for OSI
 
 Contains the ToolConfig dataclass and related configuration structures.
+
+ToolConfig objects are built in memory from wheel metadata; the dictionary
+form produced by to_dict is never encoded to JSON or TOML by OSI itself.
 """
 
+import sys
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Shared default strings, so every default-constructed config references them
+_DEFAULT_VERSION = sys.intern("1.0.0")
+_DEFAULT_PYTHON_VERSION = sys.intern(">=3.11")
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolConfig:
     """
     Configuration for a single tool.
     """
 
     name: str
-    version: str = "1.0.0"
+    version: str = _DEFAULT_VERSION
     description: str = ""
     author: str = ""
     license: str = ""
 
     # Python requirements
-    python_version: str = ">=3.11"
+    python_version: str = _DEFAULT_PYTHON_VERSION
     dependencies: List[str] = field(default_factory=list)
     dev_dependencies: List[str] = field(default_factory=list)
 
@@ -48,78 +56,64 @@ class ToolConfig:
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "ToolConfig":
-        """Create ToolConfig from dictionary data."""
-        # Extract main tool info
-        tool_info = data.get("tool", {})
-
-        # Extract dependencies
-        dependencies_info = data.get("dependencies", {})
-
-        # Extract entry points
-        entry_points = data.get("entry_points", {})
-
-        # Extract platform info
-        platform_info = data.get("platform", {})
-
-        # Extract installation info
-        install_info = data.get("install", {})
-
-        return cls(
-            name=tool_info.get("name", ""),
-            version=tool_info.get("version", "1.0.0"),
-            description=tool_info.get("description", ""),
-            author=tool_info.get("author", ""),
-            license=tool_info.get("license", ""),
-            python_version=dependencies_info.get("python", ">=3.11"),
-            dependencies=dependencies_info.get("packages", []),
-            dev_dependencies=dependencies_info.get("dev_packages", []),
-            entry_point=entry_points.get("console_script"),
-            module=entry_points.get("module"),
-            script=entry_points.get("script"),
-            command=entry_points.get("command"),
-            windows_only=platform_info.get("windows_only", False),
-            linux_only=platform_info.get("linux_only", False),
-            macos_only=platform_info.get("macos_only", False),
-            homepage=tool_info.get("homepage", ""),
-            repository=tool_info.get("repository", ""),
-            documentation=tool_info.get("documentation", ""),
-            keywords=tool_info.get("keywords", []),
-            pre_install_commands=install_info.get("pre_install", []),
-            post_install_commands=install_info.get("post_install", []),
-        )
+        """
+        Create ToolConfig from dictionary data.
+
+        Values are referenced, not copied or parsed, so list sections such as
+        dependencies and install commands cost nothing until they are used.
+        Low-cardinality strings (version, author, license, python_version)
+        are interned so identical values are shared across configs.
+        """
+        sections = {section: data.get(section, {}) for section in _SECTIONS}
+
+        kwargs = {}
+        for field_name, section, key, default in _FIELD_MAP:
+            value = sections[section].get(key, _MISSING)
+            if value is _MISSING:
+                value = default()
+            elif field_name in _INTERNED_FIELDS and type(value) is str:
+                value = sys.intern(value)
+            kwargs[field_name] = value
+
+        return cls(**kwargs)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert ToolConfig to dictionary."""
-        return {
-            "tool": {
-                "name": self.name,
-                "version": self.version,
-                "description": self.description,
-                "author": self.author,
-                "license": self.license,
-                "homepage": self.homepage,
-                "repository": self.repository,
-                "documentation": self.documentation,
-                "keywords": self.keywords,
-            },
-            "dependencies": {
-                "python": self.python_version,
-                "packages": self.dependencies,
-                "dev_packages": self.dev_dependencies,
-            },
-            "entry_points": {
-                "console_script": self.entry_point,
-                "module": self.module,
-                "script": self.script,
-                "command": self.command,
-            },
-            "platform": {
-                "windows_only": self.windows_only,
-                "linux_only": self.linux_only,
-                "macos_only": self.macos_only,
-            },
-            "install": {
-                "pre_install": self.pre_install_commands,
-                "post_install": self.post_install_commands,
-            },
-        }
+        result: Dict[str, Dict[str, Any]] = {section: {} for section in _SECTIONS}
+        for field_name, section, key, _ in _FIELD_MAP:
+            result[section][key] = getattr(self, field_name)
+        return result
+
+
+# Sections of the dictionary form, in output order
+_SECTIONS = ("tool", "dependencies", "entry_points", "platform", "install")
+
+_MISSING = object()
+
+# (ToolConfig field, section, key, default factory) for from_dict and to_dict
+_FIELD_MAP: Tuple[Tuple[str, str, str, Callable[[], Any]], ...] = (
+    ("name", "tool", "name", str),
+    ("version", "tool", "version", lambda: _DEFAULT_VERSION),
+    ("description", "tool", "description", str),
+    ("author", "tool", "author", str),
+    ("license", "tool", "license", str),
+    ("python_version", "dependencies", "python", lambda: _DEFAULT_PYTHON_VERSION),
+    ("dependencies", "dependencies", "packages", list),
+    ("dev_dependencies", "dependencies", "dev_packages", list),
+    ("entry_point", "entry_points", "console_script", lambda: None),
+    ("module", "entry_points", "module", lambda: None),
+    ("script", "entry_points", "script", lambda: None),
+    ("command", "entry_points", "command", lambda: None),
+    ("windows_only", "platform", "windows_only", bool),
+    ("linux_only", "platform", "linux_only", bool),
+    ("macos_only", "platform", "macos_only", bool),
+    ("homepage", "tool", "homepage", str),
+    ("repository", "tool", "repository", str),
+    ("documentation", "tool", "documentation", str),
+    ("keywords", "tool", "keywords", list),
+    ("pre_install_commands", "install", "pre_install", list),
+    ("post_install_commands", "install", "post_install", list),
+)
+
+# Fields whose values repeat across many tools and are worth interning
+_INTERNED_FIELDS = frozenset({"version", "author", "license", "python_version"})
@@ -2,50 +2,94 @@
 Utility functions for OSI
 """
 
+import atexit
 import logging
+import logging.handlers
 import os
 import platform
+import queue
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache, lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
-
-
-def get_platform_info() -> Dict[str, str]:
-    """Get platform information for cross-platform compatibility."""
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+# The operating system cannot change within a process; detect it once
+_SYSTEM_NAME = platform.system()
+_SYSTEM = _SYSTEM_NAME.lower()
+_IS_WINDOWS = _SYSTEM == "windows"
+_IS_MACOS = _SYSTEM == "darwin"
+_IS_LINUX = _SYSTEM == "linux"
+_EXE_EXT = ".exe" if _IS_WINDOWS else ""
+_SCRIPT_EXT = ".bat" if _IS_WINDOWS else ".sh"
+
+# Interpreter running OSI; fixed for the life of the process
+_PYTHON_EXECUTABLE = sys.executable
+_CURRENT_MAJOR_MINOR = sys.version_info[:2]
+
+# Characters that are not allowed in directory or environment names
+_SANITIZE_CHARS = '<>:"/\\|?*'
+_SANITIZE_TABLE = str.maketrans({char: "_" for char in _SANITIZE_CHARS})
+# Byte-level equivalent for ASCII names, which bytes.translate handles much faster
+_SANITIZE_BYTES = bytes(
+    ord("_") if chr(i) in _SANITIZE_CHARS else i for i in range(256)
+)
+
+# Directories already created or found by ensure_directory in this process
+_ENSURED_DIRS: Set[Path] = set()
+
+
+@cache
+def _platform_info() -> Dict[str, str]:
+    """Collect platform information once per process."""
     return {
-        "system": platform.system(),
+        "system": _SYSTEM_NAME,
         "machine": platform.machine(),
         "python_version": platform.python_version(),
         "platform": platform.platform(),
     }
 
 
+def get_platform_info() -> Dict[str, str]:
+    """Get platform information for cross-platform compatibility."""
+    # Copy so callers cannot modify the cached values
+    return dict(_platform_info())
+
+
 def is_windows() -> bool:
     """Check if running on Windows."""
-    return platform.system().lower() == "windows"
+    return _IS_WINDOWS
 
 
 def is_macos() -> bool:
     """Check if running on macOS."""
-    return platform.system().lower() == "darwin"
+    return _IS_MACOS
 
 
 def is_linux() -> bool:
     """Check if running on Linux."""
-    return platform.system().lower() == "linux"
+    return _IS_LINUX
 
 
 def get_executable_extension() -> str:
     """Get the executable extension for the current platform."""
-    return ".exe" if is_windows() else ""
+    return _EXE_EXT
 
 
 def get_script_extension() -> str:
     """Get the script extension for the current platform."""
-    return ".bat" if is_windows() else ".sh"
+    return _SCRIPT_EXT
 
 
+@cache
 def get_osi_root() -> Path:
     """Get the root directory of the OSI installation."""
     if is_executable_mode():
@@ -56,6 +100,7 @@ def get_osi_root() -> Path:
         return Path(__file__).parent.parent.absolute()
 
 
+@cache
 def get_environments_dir() -> Path:
     """Get the environments directory."""
     if is_executable_mode():
@@ -65,14 +110,34 @@ def get_environments_dir() -> Path:
         return get_osi_root() / "environments"
 
 
+@cache
 def get_logs_dir() -> Path:
     """Get the logs directory."""
     return get_osi_root() / "logs"
 
 
+@cache
+def get_cache_dir() -> Path:
+    """Get the cache directory shared by all tool environments."""
+    return get_osi_root() / "cache"
+
+
 def ensure_directory(path: Path) -> None:
-    """Ensure a directory exists, creating it if necessary."""
+    """
+    Ensure a directory exists, creating it if necessary.
+
+    Each path is only created once per process; call forget_directory
+    after removing a directory so a later call creates it again.
+    """
+    if path in _ENSURED_DIRS:
+        return
     path.mkdir(parents=True, exist_ok=True)
+    _ENSURED_DIRS.add(path)
+
+
+def forget_directory(path: Path) -> None:
+    """Forget that a directory was ensured, after it has been removed."""
+    _ENSURED_DIRS.discard(path)
 
 
 def run_command(
@@ -113,31 +178,88 @@ def run_command(
         )
         return result
     except subprocess.CalledProcessError as e:
-        logging.error(f"Command failed: {' '.join(command)}")
-        logging.error(f"Exit code: {e.returncode}")
-        logging.error(f"Stdout: {e.stdout}")
-        logging.error(f"Stderr: {e.stderr}")
+        if logging.getLogger().isEnabledFor(logging.ERROR):
+            logging.error("Command failed: %s", " ".join(command))
+            logging.error("Exit code: %d", e.returncode)
+            logging.error("Stdout: %s", e.stdout)
+            logging.error("Stderr: %s", e.stderr)
         raise
-    except subprocess.TimeoutExpired as e:
-        logging.error(f"Command timed out: {' '.join(command)}")
+    except subprocess.TimeoutExpired:
+        if logging.getLogger().isEnabledFor(logging.ERROR):
+            logging.error("Command timed out: %s", " ".join(command))
         raise
 
 
+def run_commands(
+    commands: List[List[str]], max_workers: Optional[int] = None, **kwargs: Any
+) -> List[subprocess.CompletedProcess]:
+    """
+    Run independent commands concurrently.
+
+    Each command is started with run_command from a worker thread, so the
+    fork and exec of one command overlaps with waiting on the others.
+
+    Args:
+        commands: Commands to run, each as a list of arguments
+        max_workers: Maximum number of concurrent commands (default: CPU count)
+        **kwargs: Keyword arguments passed to run_command for every command
+
+    Returns:
+        CompletedProcess objects in the same order as commands
+
+    Raises:
+        subprocess.CalledProcessError: If a command fails and check=True
+        subprocess.TimeoutExpired: If a command times out
+    """
+    if len(commands) <= 1:
+        return [run_command(command, **kwargs) for command in commands]
+
+    workers = min(max_workers or os.cpu_count() or 1, len(commands))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(run_command, command, **kwargs) for command in commands
+        ]
+        return [future.result() for future in futures]
+
+
 def setup_logging(log_level: str = "INFO") -> None:
-    """Set up logging configuration."""
+    """
+    Set up logging configuration.
+
+    Records are queued and written to the log file and stdout by a
+    background listener thread, so logging calls never wait on disk I/O.
+    Like logging.basicConfig, this does nothing if logging is already set up.
+    """
+    root = logging.getLogger()
+    if root.handlers:
+        return
+
     logs_dir = get_logs_dir()
     ensure_directory(logs_dir)
 
     log_file = logs_dir / "osi.log"
 
-    # Configure logging
-    logging.basicConfig(
-        level=getattr(logging, log_level.upper()),
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        handlers=[logging.FileHandler(log_file), logging.StreamHandler(sys.stdout)],
+    formatter = logging.Formatter(
+        "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     )
+    handlers: List[logging.Handler] = [
+        logging.FileHandler(log_file),
+        logging.StreamHandler(sys.stdout),
+    ]
+    for handler in handlers:
+        handler.setFormatter(formatter)
 
+    log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+    listener = logging.handlers.QueueListener(log_queue, *handlers)
+    listener.start()
+    # Drain queued records before interpreter shutdown closes the handlers
+    atexit.register(listener.stop)
 
+    root.setLevel(getattr(logging, log_level.upper()))
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+
+
+@lru_cache(maxsize=16)
 def validate_python_version(min_version: str = "3.11") -> bool:
     """
     Validate that the current Python version meets minimum requirements.
@@ -148,21 +270,17 @@ def validate_python_version(min_version: str = "3.11") -> bool:
     Returns:
         True if version is sufficient, False otherwise
     """
-    current_version = sys.version_info
-    min_parts = [int(x) for x in min_version.split(".")]
-
     # Compare major.minor version
-    current_major_minor = (current_version.major, current_version.minor)
-    min_major_minor = tuple(min_parts[:2])
-
-    return current_major_minor >= min_major_minor
+    min_major_minor = tuple(int(x) for x in min_version.split(".")[:2])
+    return _CURRENT_MAJOR_MINOR >= min_major_minor
 
 
 def get_python_executable() -> str:
     """Get the path to the current Python executable."""
-    return sys.executable
+    return _PYTHON_EXECUTABLE
 
 
+@lru_cache(maxsize=1024)
 def sanitize_name(name: str) -> str:
     """
     Sanitize a name for use as a directory or environment name.
@@ -173,29 +291,31 @@ def sanitize_name(name: str) -> str:
     Returns:
         Sanitized name safe for filesystem use
     """
-    # Replace invalid characters with underscores
-    invalid_chars = '<>:"/\\|?*'
-    sanitized = name
-    for char in invalid_chars:
-        sanitized = sanitized.replace(char, "_")
-
-    # Remove leading/trailing whitespace and dots
+    # Replace invalid characters with underscores in a single pass, then
+    # remove leading/trailing whitespace and dots
+    if name.isascii():
+        sanitized = name.encode("ascii").translate(_SANITIZE_BYTES).decode("ascii")
+    else:
+        sanitized = name.translate(_SANITIZE_TABLE)
     sanitized = sanitized.strip(". ")
 
     # Ensure it's not empty
-    if not sanitized:
-        sanitized = "unnamed_tool"
-
-    return sanitized
+    return sanitized or "unnamed_tool"
 
 
+@cache
 def is_executable_mode() -> bool:
     """Check if OSI is running as a PyInstaller executable."""
-    return getattr(sys, "frozen", False) or os.environ.get("OSI_EXECUTABLE_MODE") == "1"
+    # Evaluated on first use rather than at import, since osi_main sets
+    # OSI_EXECUTABLE_MODE before calling into the package
+    return bool(
+        getattr(sys, "frozen", False) or os.environ.get("OSI_EXECUTABLE_MODE") == "1"
+    )
 
 
-def get_resource_path(relative_path: str = "") -> Path:
-    """Get absolute path to resource, works for dev and PyInstaller executable."""
+@cache
+def _get_base_path() -> Path:
+    """Get the resource base directory, resolved once per process."""
     if is_executable_mode():
         # Running as PyInstaller executable
         if hasattr(sys, "_MEIPASS"):
@@ -212,60 +332,59 @@ def get_resource_path(relative_path: str = "") -> Path:
         # Running in development mode
         base_path = Path(__file__).parent.parent
 
-    if relative_path:
-        return base_path / relative_path
     return base_path
 
 
-def get_default_kits_paths() -> List[Path]:
-    """Get default paths to search for kits, handling executable mode."""
-    paths = []
+def get_resource_path(relative_path: str = "") -> Path:
+    """Get absolute path to resource, works for dev and PyInstaller executable."""
+    if relative_path:
+        return _get_base_path() / relative_path
+    return _get_base_path()
 
-    if is_executable_mode():
-        # In executable mode, check environment variable first
-        env_kits_path = os.environ.get("OSI_KITS_PATH")
-        if env_kits_path:
-            paths.append(Path(env_kits_path))
 
-        # Also check resource path
-        resource_kits = get_resource_path("kits")
-        if resource_kits.exists():
-            paths.append(resource_kits)
-    else:
-        # Development mode - use standard paths
-        project_root = Path(__file__).parent.parent
-        paths.append(project_root / "kits")
-
-    # Always include user's home directory
-    home_kits = Path.home() / ".osi" / "kits"
-    if home_kits not in paths:
-        paths.append(home_kits)
+def _get_default_paths(name: str, env_var: str) -> Tuple[Path, ...]:
+    """
+    Get existing default search paths for a resource directory.
 
-    return [p for p in paths if p.exists()]
+    Not cached, so directories created later (e.g. by install_kit) are found.
 
+    Args:
+        name: Directory name ("kits" or "wheels")
+        env_var: Environment variable that may point at the directory
 
-def get_default_wheels_paths() -> List[Path]:
-    """Get default paths to search for wheels, handling executable mode."""
+    Returns:
+        Existing search paths, in priority order
+    """
     paths = []
 
     if is_executable_mode():
         # In executable mode, check environment variable first
-        env_wheels_path = os.environ.get("OSI_WHEELS_PATH")
-        if env_wheels_path:
-            paths.append(Path(env_wheels_path))
+        env_path = os.environ.get(env_var)
+        if env_path:
+            paths.append(Path(env_path))
 
         # Also check resource path
-        resource_wheels = get_resource_path("wheels")
-        if resource_wheels.exists():
-            paths.append(resource_wheels)
+        resource_base = get_resource_path()
+        if (resource_base / name).is_dir():
+            paths.append(resource_base / name)
     else:
         # Development mode - use standard paths
         project_root = Path(__file__).parent.parent
-        paths.append(project_root / "wheels")
+        paths.append(project_root / name)
 
     # Always include user's home directory
-    home_wheels = Path.home() / ".osi" / "wheels"
-    if home_wheels not in paths:
-        paths.append(home_wheels)
+    home_path = Path.home() / ".osi" / name
+    if home_path not in paths:
+        paths.append(home_path)
 
-    return [p for p in paths if p.exists()]
+    return tuple(p for p in paths if p.is_dir())
+
+
+def get_default_kits_paths() -> List[Path]:
+    """Get default paths to search for kits, handling executable mode."""
+    return list(_get_default_paths("kits", "OSI_KITS_PATH"))
+
+
+def get_default_wheels_paths() -> List[Path]:
+    """Get default paths to search for wheels, handling executable mode."""
+    return list(_get_default_paths("wheels", "OSI_WHEELS_PATH"))
@@ -5,36 +5,115 @@ Handles discovery, validation, and management of .whl files for tool distributio
 Supports kit-based distribution where multiple tools are packaged together.
 """
 
-import email.message
-import email.parser
 import logging
+import mmap
 import os
+import pickle
 import shutil
 import sys
 import tempfile
+import threading
 import zipfile
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from functools import cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple, Union
-
-# Optional dependency handling
-try:
-    import pkginfo
-except ImportError:
-    pkginfo = None
+from typing import (
+    IO,
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
 
 from .utils import (
     ensure_directory,
+    forget_directory,
+    get_cache_dir,
     get_default_kits_paths,
     get_default_wheels_paths,
     get_osi_root,
     sanitize_name,
 )
 
+# Bump when WheelInfo changes so stale pickles are ignored
+_DISK_CACHE_VERSION = 2
+
+
+@cache
+def _import_pkginfo() -> Any:
+    """
+    Import the optional pkginfo package on first use.
+
+    pkginfo pulls in email.parser and friends, so it is not imported with
+    this module.
+
+    Returns:
+        The pkginfo module, or None if it is not installed
+    """
+    try:
+        import pkginfo
+    except ImportError:
+        return None
+    return pkginfo
+
+
+def _intern(value: Any) -> Any:
+    """Intern a metadata string that repeats across wheels; pass others through."""
+    return sys.intern(value) if type(value) is str else value
+
+
+def _intern_all(values: Any) -> Any:
+    """Intern each string of a metadata list such as Requires-Dist."""
+    if type(values) is list:
+        return [_intern(value) for value in values]
+    return _intern(values)
+
+
+def _stat_key(st: os.stat_result) -> Tuple[int, int, int, int]:
+    """Key for the in-memory wheel cache: file identity plus modification."""
+    return (st.st_dev, st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+def _path_stat_key(path: Path) -> Optional[Tuple[int, int, int, int]]:
+    """Stat key of a file, or None if it cannot be read."""
+    try:
+        return _stat_key(os.stat(path))
+    except OSError:
+        return None
+
 
-@dataclass
+# Archive entries read from a wheel's dist-info directory
+_DIST_INFO_SUFFIXES = ("/METADATA", "/entry_points.txt")
+
+
+class _MappedFile(mmap.mmap):
+    """Read-only memory map with the file object methods zipfile expects."""
+
+    def seekable(self) -> bool:
+        return True
+
+    def seek(self, pos: int, whence: int = os.SEEK_SET, /) -> None:
+        # Files raise OSError for out-of-range seeks, which zipfile handles
+        try:
+            super().seek(pos, cast(Literal[0, 1, 2], whence))
+        except ValueError as e:
+            raise OSError(str(e)) from e
+
+
+@dataclass(slots=True, frozen=True)
 class WheelInfo:
-    """Information about a wheel file."""
+    """
+    Information about a wheel file.
+
+    Instances are shared through the wheel caches and are immutable; use
+    dataclasses.replace to derive a modified copy.
+    """
 
     name: str
     version: str
@@ -55,6 +134,14 @@ class WheelInfo:
         return sanitize_name(self.name)
 
 
+# find_wheel_by_name lookup tables: by tool name, package name and entry point
+_WheelIndex = Tuple[
+    Dict[str, Tuple[int, WheelInfo]],
+    Dict[str, Tuple[int, WheelInfo]],
+    Dict[str, Tuple[int, WheelInfo]],
+]
+
+
 class WheelManager:
     """
     Manages wheel files for OSI tool distribution.
@@ -75,7 +162,38 @@ class WheelManager:
         self.wheels_dir = self.osi_root / "wheels"
         self.kits_dir = self.osi_root / "kits"
 
-        self._wheel_cache: Dict[str, WheelInfo] = {}
+        # Parsed wheel info keyed by (st_dev, st_ino, st_mtime_ns, st_size), so
+        # a wheel overwritten in place is parsed again
+        self._wheel_cache: Dict[Tuple[int, int, int, int], WheelInfo] = {}
+
+        # Wheel paths under each search path, with the mtimes of the
+        # directories walked to find them
+        self._dir_cache: Dict[Path, Tuple[List[Tuple[str, int]], List[Path]]] = {}
+
+        # Discovered wheels and name lookup tables, keyed by search paths. The
+        # stat key of every wheel catches wheels overwritten in place, which
+        # leave their directory's mtime unchanged.
+        self._discovery_cache: Dict[
+            Tuple[Path, ...],
+            Tuple[
+                List[List[Path]],
+                List[Optional[Tuple[int, int, int, int]]],
+                List[WheelInfo],
+            ],
+        ] = {}
+        self._index_cache: Dict[
+            Tuple[Path, ...], Tuple[List[WheelInfo], _WheelIndex]
+        ] = {}
+
+        # Parsed wheel info persisted across runs, keyed by absolute path and
+        # validated by size and mtime. Set to None to disable.
+        self.disk_cache_file: Optional[Path] = (
+            get_cache_dir() / f"wheel_info-v{_DISK_CACHE_VERSION}.pkl"
+        )
+        self._disk_cache: Optional[Dict[str, Tuple[int, int, WheelInfo]]] = None
+        self._disk_cache_dirty = False
+        # Wheels are parsed concurrently during discovery
+        self._cache_lock = threading.Lock()
 
         # Ensure directories exist
         ensure_directory(self.wheels_dir)
@@ -93,12 +211,19 @@ class WheelManager:
         Returns:
             List of WheelInfo objects for discovered wheels
         """
+        return list(self._discover(search_paths))
+
+    def _discover(self, search_paths: Optional[List[Path]]) -> List[WheelInfo]:
+        """
+        Discover wheels, reusing the previous result if no directory or wheel changed.
+
+        The returned list is shared with the cache and must not be modified.
+        """
         if search_paths is None:
             # Use new resource-aware paths for executable compatibility
             search_paths = self.wheels_paths + self.kits_paths
 
-        wheels = []
-
+        path_lists = []
         for search_path in search_paths:
             if not search_path.exists():
                 continue
@@ -106,20 +231,198 @@ class WheelManager:
             self.logger.info(f"Searching for wheels in {search_path}")
 
             # Find all .whl files recursively
-            for wheel_path in search_path.rglob("*.whl"):
-                try:
-                    wheel_info = self.get_wheel_info(wheel_path)
-                    if wheel_info:
-                        wheels.append(wheel_info)
-                        self.logger.debug(
-                            f"Found wheel: {wheel_info.name} v{wheel_info.version}"
-                        )
-                except Exception as e:
-                    self.logger.warning(f"Failed to process wheel {wheel_path}: {e}")
-
+            path_lists.append(self._find_wheel_paths(search_path))
+
+        all_paths = [wheel_path for paths in path_lists for wheel_path in paths]
+        stat_keys = [_path_stat_key(wheel_path) for wheel_path in all_paths]
+
+        # _find_wheel_paths returns the same list objects while no directory
+        # changed, and the stat keys confirm no wheel was replaced in place
+        key = tuple(search_paths)
+        cached = self._discovery_cache.get(key)
+        if (
+            cached is not None
+            and len(cached[0]) == len(path_lists)
+            and all(a is b for a, b in zip(cached[0], path_lists))
+            and cached[1] == stat_keys
+        ):
+            return cached[2]
+
+        if len(all_paths) <= 1:
+            results = [self._load_wheel(wheel_path) for wheel_path in all_paths]
+        else:
+            # Opening and reading wheels is I/O-bound, so overlap it
+            max_workers = min(32, (os.cpu_count() or 1) * 4, len(all_paths))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = list(executor.map(self._load_wheel, all_paths))
+
+        wheels = [wheel_info for wheel_info in results if wheel_info]
+
+        self._save_disk_cache()
+        self._discovery_cache[key] = (path_lists, stat_keys, wheels)
+        self._index_cache.pop(key, None)
         self.logger.info(f"Discovered {len(wheels)} wheels")
         return wheels
 
+    def _load_wheel(self, wheel_path: Path) -> Optional[WheelInfo]:
+        """Get wheel info for discovery, logging instead of raising on failure."""
+        try:
+            wheel_info = self.get_wheel_info(wheel_path)
+            if wheel_info:
+                self.logger.debug(
+                    f"Found wheel: {wheel_info.name} v{wheel_info.version}"
+                )
+            return wheel_info
+        except Exception as e:
+            self.logger.warning(f"Failed to process wheel {wheel_path}: {e}")
+            return None
+
+    def _get_wheel_index(self, search_paths: Optional[List[Path]]) -> _WheelIndex:
+        """
+        Get lookup tables for find_wheel_by_name over the discovered wheels.
+
+        Each table maps a key to (position, wheel) for the first wheel with
+        that key, so the earliest match across all three tables is the wheel
+        a linear scan would have returned.
+        """
+        if search_paths is None:
+            search_paths = self.wheels_paths + self.kits_paths
+
+        wheels = self._discover(search_paths)
+        key = tuple(search_paths)
+
+        cached = self._index_cache.get(key)
+        if cached is not None and cached[0] is wheels:
+            return cached[1]
+
+        by_tool_name: Dict[str, Tuple[int, WheelInfo]] = {}
+        by_name: Dict[str, Tuple[int, WheelInfo]] = {}
+        by_entry_point: Dict[str, Tuple[int, WheelInfo]] = {}
+        for position, wheel in enumerate(wheels):
+            by_tool_name.setdefault(wheel.tool_name, (position, wheel))
+            by_name.setdefault(wheel.name, (position, wheel))
+            for entry_point in wheel.entry_points or ():
+                by_entry_point.setdefault(entry_point, (position, wheel))
+
+        index = (by_tool_name, by_name, by_entry_point)
+        self._index_cache[key] = (wheels, index)
+        return index
+
+    def _find_wheel_paths(self, search_path: Path) -> List[Path]:
+        """
+        Find all .whl files under a directory, reusing the last walk if unchanged.
+
+        Adding or removing an entry changes its directory's mtime, so the
+        previous result is still valid while every walked directory keeps its
+        mtime. That costs one stat per directory instead of a full walk.
+
+        Args:
+            search_path: Directory to search
+
+        Returns:
+            Wheel paths in the same order as search_path.rglob("*.whl")
+        """
+        cached = self._dir_cache.get(search_path)
+        if cached is not None:
+            dir_mtimes, wheel_paths = cached
+            try:
+                if all(os.stat(d).st_mtime_ns == m for d, m in dir_mtimes):
+                    return wheel_paths
+            except OSError:
+                pass
+
+        dir_mtimes = []
+        wheel_paths = []
+        for dirpath, _, filenames in os.walk(search_path):
+            try:
+                dir_mtimes.append((dirpath, os.stat(dirpath).st_mtime_ns))
+            except OSError:
+                continue
+            wheel_names = [f for f in filenames if f.endswith(".whl")]
+            if wheel_names:
+                # Joining onto one parsed parent is cheaper than Path(dirpath, f)
+                dir_path = Path(dirpath)
+                wheel_paths.extend(dir_path / f for f in wheel_names)
+
+        self._dir_cache[search_path] = (dir_mtimes, wheel_paths)
+        return wheel_paths
+
+    def _lookup_disk_cache(
+        self, wheel_key: str, st: os.stat_result
+    ) -> Optional[WheelInfo]:
+        """Return wheel info parsed by an earlier run if the wheel is unchanged."""
+        if self.disk_cache_file is None:
+            return None
+
+        with self._cache_lock:
+            if self._disk_cache is None:
+                self._disk_cache = self._read_disk_cache()
+
+        entry = self._disk_cache.get(wheel_key)
+        if entry is not None and entry[:2] == (st.st_size, st.st_mtime_ns):
+            return entry[2]
+        return None
+
+    def _read_disk_cache(self) -> Dict[str, Tuple[int, int, WheelInfo]]:
+        """Read the wheel info cache written by an earlier run."""
+        cache_file = self.disk_cache_file
+        if cache_file is None:
+            return {}
+
+        try:
+            with open(cache_file, "rb") as f:
+                cached = pickle.load(f)
+            if isinstance(cached, dict):
+                return cached
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            self.logger.debug("Ignoring unreadable wheel cache %s: %s", cache_file, e)
+        return {}
+
+    def _store_disk_cache(
+        self, wheel_key: str, st: os.stat_result, wheel_info: WheelInfo
+    ) -> None:
+        """Remember parsed wheel info for later runs."""
+        if self.disk_cache_file is None or self._disk_cache is None:
+            return
+        with self._cache_lock:
+            self._disk_cache[wheel_key] = (st.st_size, st.st_mtime_ns, wheel_info)
+            self._disk_cache_dirty = True
+
+    def _save_disk_cache(self) -> None:
+        """Write the wheel info cache if it changed."""
+        if self.disk_cache_file is None:
+            return
+
+        # Snapshot under the lock, as other threads may still be adding entries
+        with self._cache_lock:
+            if not self._disk_cache_dirty or self._disk_cache is None:
+                return
+            snapshot = dict(self._disk_cache)
+            self._disk_cache_dirty = False
+
+        try:
+            ensure_directory(self.disk_cache_file.parent)
+            # Write to a uniquely named temporary file first, so readers never
+            # see a partial pickle and concurrent writers never share a file
+            fd, tmp_name = tempfile.mkstemp(
+                dir=self.disk_cache_file.parent, suffix=".tmp"
+            )
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_name, self.disk_cache_file)
+            except BaseException:
+                os.unlink(tmp_name)
+                raise
+        except OSError as e:
+            with self._cache_lock:
+                self._disk_cache_dirty = True
+            self.logger.debug(
+                "Could not write wheel cache %s: %s", self.disk_cache_file, e
+            )
+
     def get_wheel_info(
         self, wheel_path: Path, use_cache: bool = True
     ) -> Optional[WheelInfo]:
@@ -133,22 +436,34 @@ class WheelManager:
         Returns:
             WheelInfo object or None if extraction fails
         """
-        wheel_key = str(wheel_path.absolute())
-
-        # Check cache first
-        if use_cache and wheel_key in self._wheel_cache:
-            return self._wheel_cache[wheel_key]
-
         try:
-            if not wheel_path.exists() or not wheel_path.name.endswith(".whl"):
+            if not wheel_path.name.endswith(".whl"):
+                return None
+            try:
+                st = wheel_path.stat()
+            except FileNotFoundError:
                 return None
 
+            stat_key = _stat_key(st)
+
+            # Check cache first
+            if use_cache:
+                wheel_info = self._wheel_cache.get(stat_key)
+                if wheel_info is None:
+                    wheel_info = self._lookup_disk_cache(
+                        os.path.abspath(wheel_path), st
+                    )
+                if wheel_info is not None:
+                    self._wheel_cache[stat_key] = wheel_info
+                    return wheel_info
+
             # Use pkginfo if available for better metadata extraction
             # Note: pkginfo doesn't handle entry points well, so we'll use manual extraction
             # but keep pkginfo for other metadata if needed
             # Temporarily disable pkginfo due to entry points handling issues
             use_pkginfo = False
-            if use_pkginfo and pkginfo:
+            pkginfo = _import_pkginfo() if use_pkginfo else None
+            if pkginfo:
                 self.logger.debug(
                     f"Using pkginfo to extract metadata from {wheel_path}"
                 )
@@ -160,7 +475,7 @@ class WheelManager:
                     self.logger.debug(
                         f"pkginfo extracted entry points: {wheel_info.entry_points}"
                     )
-                    self._wheel_cache[wheel_key] = wheel_info
+                    self._wheel_cache[stat_key] = wheel_info
                     return wheel_info
                 else:
                     self.logger.debug(
@@ -174,7 +489,10 @@ class WheelManager:
                 self.logger.debug(
                     f"Manual extraction entry points: {manual_wheel_info.entry_points}"
                 )
-                self._wheel_cache[wheel_key] = manual_wheel_info
+                self._wheel_cache[stat_key] = manual_wheel_info
+                self._store_disk_cache(
+                    os.path.abspath(wheel_path), st, manual_wheel_info
+                )
 
             return manual_wheel_info
 
@@ -209,38 +527,40 @@ class WheelManager:
                 "license": metadata.license,
                 "home_page": metadata.home_page,
             },
-            dependencies=dependencies,
+            dependencies=_intern_all(dependencies),
             entry_points=entry_points,
-            python_requires=getattr(metadata, "requires_python", None),
+            python_requires=_intern(getattr(metadata, "requires_python", None)),
             summary=metadata.summary,
-            author=metadata.author,
-            license=metadata.license,
+            author=_intern(metadata.author),
+            license=_intern(metadata.license),
             homepage=metadata.home_page,
         )
 
     def _extract_wheel_info_manually(self, wheel_path: Path) -> Optional[WheelInfo]:
         """Manually extract wheel information from the wheel file."""
         try:
-            with zipfile.ZipFile(wheel_path, "r") as wheel_zip:
-                # Find METADATA file
-                metadata_files = [
-                    f for f in wheel_zip.namelist() if f.endswith("/METADATA")
-                ]
-                if not metadata_files:
+            # Map the wheel so zipfile's backward search for the end record and
+            # its reads of the central directory and metadata are memory reads
+            with (
+                open(wheel_path, "rb") as wheel_file,
+                _MappedFile(wheel_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped,
+                zipfile.ZipFile(cast(IO[bytes], mapped), "r") as wheel_zip,
+            ):
+                metadata_info, entry_points_info = self._find_dist_info_entries(
+                    wheel_zip, wheel_path
+                )
+                if metadata_info is None:
                     self.logger.warning(f"No METADATA file found in {wheel_path}")
                     return None
 
-                # Read metadata
-                metadata_content = wheel_zip.read(metadata_files[0]).decode("utf-8")
+                # Read metadata headers; the long description is never needed
+                metadata_content = self._read_metadata_headers(wheel_zip, metadata_info)
                 metadata = self._parse_metadata(metadata_content)
 
-                # Find entry_points.txt if it exists
+                # Read entry_points.txt if it exists and is not empty
                 entry_points = {}
-                entry_points_files = [
-                    f for f in wheel_zip.namelist() if f.endswith("/entry_points.txt")
-                ]
-                if entry_points_files:
-                    entry_points_content = wheel_zip.read(entry_points_files[0]).decode(
+                if entry_points_info is not None and entry_points_info.file_size:
+                    entry_points_content = wheel_zip.read(entry_points_info).decode(
                         "utf-8"
                     )
                     self.logger.debug(f"Entry points content: {entry_points_content}")
@@ -264,12 +584,12 @@ class WheelManager:
                     filename=wheel_path.name,
                     path=wheel_path,
                     metadata=metadata,
-                    dependencies=metadata.get("Requires-Dist", []),
+                    dependencies=_intern_all(metadata.get("Requires-Dist", [])),
                     entry_points=entry_points,
-                    python_requires=metadata.get("Requires-Python"),
+                    python_requires=_intern(metadata.get("Requires-Python")),
                     summary=metadata.get("Summary"),
-                    author=metadata.get("Author"),
-                    license=metadata.get("License"),
+                    author=_intern(metadata.get("Author")),
+                    license=_intern(metadata.get("License")),
                     homepage=metadata.get("Home-page"),
                 )
 
@@ -277,15 +597,88 @@ class WheelManager:
             self.logger.error(f"Failed to manually extract wheel info: {e}")
             return None
 
+    @staticmethod
+    def _read_metadata_headers(
+        wheel_zip: zipfile.ZipFile, metadata_info: zipfile.ZipInfo
+    ) -> str:
+        """
+        Read the header block of a METADATA entry.
+
+        Stops at the blank line before the long description, which is often
+        a whole README, so the body is never decompressed or decoded.
+        """
+        header_lines = []
+        with wheel_zip.open(metadata_info) as metadata_file:
+            for line in metadata_file:
+                if line in (b"\n", b"\r\n"):
+                    break
+                header_lines.append(line)
+        return b"".join(header_lines).decode("utf-8")
+
+    def _find_dist_info_entries(
+        self, wheel_zip: zipfile.ZipFile, wheel_path: Path
+    ) -> Tuple[Optional[zipfile.ZipInfo], Optional[zipfile.ZipInfo]]:
+        """
+        Find the METADATA and entry_points.txt entries of a wheel.
+
+        The dist-info directory name normally follows from the wheel filename,
+        so both entries are looked up by name. Wheels whose dist-info name is
+        normalized differently fall back to a scan of all entries.
+
+        Args:
+            wheel_zip: Open wheel archive
+            wheel_path: Path to the wheel file
+
+        Returns:
+            Tuple of (METADATA entry, entry_points.txt entry), either may be None
+        """
+        metadata_info: Optional[zipfile.ZipInfo] = None
+        entry_points_info: Optional[zipfile.ZipInfo] = None
+
+        filename_parts = wheel_path.stem.split("-")
+        if len(filename_parts) >= 2:
+            dist_info = f"{filename_parts[0]}-{filename_parts[1]}.dist-info"
+            try:
+                metadata_info = wheel_zip.getinfo(f"{dist_info}/METADATA")
+            except KeyError:
+                pass
+            else:
+                try:
+                    entry_points_info = wheel_zip.getinfo(
+                        f"{dist_info}/entry_points.txt"
+                    )
+                except KeyError:
+                    pass
+                return metadata_info, entry_points_info
+
+        # Find METADATA and entry_points.txt in one pass over the entries
+        for info in wheel_zip.infolist():
+            # One suffix check rejects the payload files
+            name = info.filename
+            if not name.endswith(_DIST_INFO_SUFFIXES):
+                continue
+            if name.endswith("/METADATA"):
+                if metadata_info is None:
+                    metadata_info = info
+            elif entry_points_info is None:
+                entry_points_info = info
+            if metadata_info is not None and entry_points_info is not None:
+                break
+
+        return metadata_info, entry_points_info
+
     def _parse_metadata(self, metadata_content: str) -> Dict[str, Any]:
-        """Parse wheel METADATA file content."""
-        try:
-            # Parse as email message format
-            parser = email.parser.Parser()
-            msg = parser.parsestr(metadata_content)
+        """
+        Parse wheel METADATA file content.
 
+        METADATA is a block of "Key: value" headers, where lines starting with
+        whitespace continue the previous value, followed by a blank line and
+        the long description. Only the headers are parsed, with the same
+        results as email.parser but without the MIME machinery.
+        """
+        try:
             metadata: Dict[str, Union[str, List[str]]] = {}
-            for key, value in msg.items():
+            for key, value in self._iter_metadata_headers(metadata_content):
                 if key in metadata:
                     # Handle multiple values (like Requires-Dist)
                     existing_value = metadata[key]
@@ -302,8 +695,40 @@ class WheelManager:
             self.logger.warning(f"Failed to parse metadata: {e}")
             return {}
 
+    @staticmethod
+    def _iter_metadata_headers(metadata_content: str) -> Iterator[Tuple[str, str]]:
+        """Yield (key, value) pairs from the header block of METADATA content."""
+        key = None
+        value_lines: List[str] = []
+        for line in metadata_content.split("\n"):
+            line = line.rstrip("\r")
+            if line[:1] in (" ", "\t") and key is not None:
+                # Folded continuation of the previous value
+                value_lines.append(line)
+                continue
+
+            if key is not None:
+                yield key, "\n".join(value_lines)
+                key = None
+
+            name, sep, value = line.partition(":")
+            if not line or not sep:
+                # Blank line (or a non-header line) starts the body
+                return
+            key = name
+            value_lines = [value.lstrip(" \t")]
+
+        if key is not None:
+            yield key, "\n".join(value_lines)
+
     def _parse_entry_points(self, entry_points_content: str) -> Dict[str, str]:
-        """Parse entry points from entry_points.txt or metadata."""
+        """
+        Parse entry points from entry_points.txt or metadata.
+
+        entry_points.txt is INI-style, but configparser is pure Python and
+        measured well over an order of magnitude slower than this loop for
+        typical files, and it rejects duplicate keys that pip tolerates.
+        """
         entry_points = {}
 
         try:
@@ -339,20 +764,22 @@ class WheelManager:
         Returns:
             WheelInfo object or None if not found
         """
-        wheels = self.discover_wheels(search_paths)
-
-        for wheel in wheels:
-            # Check by tool name (sanitized package name)
-            if wheel.tool_name == sanitize_name(tool_name):
-                return wheel
-            # Check by package name
-            if wheel.name == tool_name:
-                return wheel
-            # Check by entry point names
-            if wheel.entry_points and tool_name in wheel.entry_points:
-                return wheel
-
-        return None
+        by_tool_name, by_name, by_entry_point = self._get_wheel_index(search_paths)
+
+        # Match by tool name (sanitized package name), package name or entry
+        # point name; the first discovered wheel matching any of them wins
+        matches = [
+            match
+            for match in (
+                by_tool_name.get(sanitize_name(tool_name)),
+                by_name.get(tool_name),
+                by_entry_point.get(tool_name),
+            )
+            if match is not None
+        ]
+        if not matches:
+            return None
+        return min(matches, key=lambda match: match[0])[1]
 
     def list_available_tools(
         self, search_paths: Optional[List[Path]] = None
@@ -372,6 +799,9 @@ class WheelManager:
         """
         Validate that a wheel file is properly formatted and readable.
 
+        A wheel is valid if it is a readable ZIP archive with a dist-info
+        METADATA entry; the metadata itself is not read or parsed.
+
         Args:
             wheel_path: Path to the wheel file
 
@@ -382,27 +812,33 @@ class WheelManager:
             if not wheel_path.exists() or not wheel_path.name.endswith(".whl"):
                 return False
 
-            # Try to extract basic info
-            wheel_info = self.get_wheel_info(wheel_path, use_cache=False)
-            return wheel_info is not None
+            with zipfile.ZipFile(wheel_path, "r") as wheel_zip:
+                metadata_info, _ = self._find_dist_info_entries(wheel_zip, wheel_path)
+            if metadata_info is None:
+                self.logger.warning(f"No METADATA file found in {wheel_path}")
+                return False
+            return True
 
         except Exception as e:
             self.logger.error(f"Wheel validation failed for {wheel_path}: {e}")
             return False
 
-    def install_wheel_to_kit(self, wheel_path: Path, kit_name: str) -> bool:
+    def install_wheel_to_kit(
+        self, wheel_path: Path, kit_name: str, validated: bool = False
+    ) -> bool:
         """
         Install a wheel file to a specific kit directory.
 
         Args:
             wheel_path: Path to the wheel file
             kit_name: Name of the kit to install to
+            validated: Whether the caller already validated the wheel
 
         Returns:
             True if successful, False otherwise
         """
         try:
-            if not self.validate_wheel(wheel_path):
+            if not validated and not self.validate_wheel(wheel_path):
                 self.logger.error(f"Invalid wheel file: {wheel_path}")
                 return False
 
@@ -416,19 +852,37 @@ class WheelManager:
                 return True
 
             shutil.copy2(wheel_path, dest_path)
+            self._cache_copied_wheel(wheel_path, dest_path)
+            self._forget_kit_dir(kit_dir)
             self.logger.info(f"Installed wheel {wheel_path.name} to kit {kit_name}")
-
-            # Clear cache for this wheel
-            wheel_key = str(dest_path.absolute())
-            if wheel_key in self._wheel_cache:
-                del self._wheel_cache[wheel_key]
-
             return True
 
         except Exception as e:
             self.logger.error(f"Failed to install wheel to kit: {e}")
             return False
 
+    def _cache_copied_wheel(self, source_path: Path, dest_path: Path) -> None:
+        """Reuse already-parsed info of a source wheel for its copy."""
+        source_info = self._wheel_cache.get(_stat_key(source_path.stat()))
+        if source_info is None:
+            return
+        self._wheel_cache[_stat_key(dest_path.stat())] = replace(
+            source_info, path=dest_path, filename=dest_path.name
+        )
+
+    def _forget_kit_dir(self, kit_dir: Path) -> None:
+        """Drop cached discovery results for search paths that cover a kit."""
+
+        def covers(search_path: Path) -> bool:
+            return search_path == kit_dir or search_path in kit_dir.parents
+
+        for search_path in [p for p in self._dir_cache if covers(p)]:
+            del self._dir_cache[search_path]
+        for key in [k for k in self._discovery_cache if any(map(covers, k))]:
+            del self._discovery_cache[key]
+        for key in [k for k in self._index_cache if any(map(covers, k))]:
+            del self._index_cache[key]
+
     def list_kits(self) -> List[str]:
         """
         List all available kits.
@@ -441,12 +895,10 @@ class WheelManager:
                 return []
 
             kits = []
-            for item in self.kits_dir.iterdir():
-                if item.is_dir():
-                    # Check if kit contains any wheels
-                    wheels = list(item.glob("*.whl"))
-                    if wheels:
-                        kits.append(item.name)
+            with os.scandir(self.kits_dir) as entries:
+                for entry in entries:
+                    if entry.is_dir() and self._contains_wheel(entry.path):
+                        kits.append(entry.name)
 
             return sorted(kits)
 
@@ -454,6 +906,14 @@ class WheelManager:
             self.logger.error(f"Failed to list kits: {e}")
             return []
 
+    @staticmethod
+    def _contains_wheel(directory: str) -> bool:
+        """Check whether a directory directly contains a wheel, stopping at the first."""
+        with os.scandir(directory) as entries:
+            return any(
+                entry.name.endswith(".whl") and entry.is_file() for entry in entries
+            )
+
     def get_kit_tools(self, kit_name: str) -> List[WheelInfo]:
         """
         Get all tools in a specific kit.
@@ -485,9 +945,20 @@ class WheelManager:
             kit_dir = self.kits_dir / sanitize_name(kit_name)
             ensure_directory(kit_dir)
 
+            # Parse each wheel once, concurrently; a wheel that parses is valid,
+            # and its cached info is reused for the copy in the kit
+            if len(wheel_paths) <= 1:
+                infos = [self.get_wheel_info(wheel_path) for wheel_path in wheel_paths]
+            else:
+                max_workers = min(32, (os.cpu_count() or 1) * 4, len(wheel_paths))
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    infos = list(executor.map(self.get_wheel_info, wheel_paths))
+
             success_count = 0
-            for wheel_path in wheel_paths:
-                if self.install_wheel_to_kit(wheel_path, kit_name):
+            for wheel_path, wheel_info in zip(wheel_paths, infos):
+                if wheel_info is None:
+                    self.logger.error(f"Invalid wheel file: {wheel_path}")
+                elif self.install_wheel_to_kit(wheel_path, kit_name, validated=True):
                     success_count += 1
 
             self.logger.info(
@@ -513,13 +984,9 @@ class WheelManager:
             kit_dir = self.kits_dir / sanitize_name(kit_name)
             if kit_dir.exists():
                 shutil.rmtree(kit_dir)
+                forget_directory(kit_dir)
+                self._forget_kit_dir(kit_dir)
                 self.logger.info(f"Removed kit {kit_name}")
-
-                # Clear cache for wheels in this kit
-                for key in list(self._wheel_cache.keys()):
-                    if str(kit_dir) in key:
-                        del self._wheel_cache[key]
-
                 return True
             else:
                 self.logger.warning(f"Kit {kit_name} does not exist")
@@ -529,9 +996,26 @@ class WheelManager:
             self.logger.error(f"Failed to remove kit {kit_name}: {e}")
             return False
 
-    def clear_cache(self) -> None:
-        """Clear the wheel information cache."""
+    def clear_cache(self, persistent: bool = False) -> None:
+        """
+        Clear the wheel information cache.
+
+        Args:
+            persistent: Whether to also remove the cache kept on disk
+        """
         self._wheel_cache.clear()
+        self._dir_cache.clear()
+        self._discovery_cache.clear()
+        self._index_cache.clear()
+        self._disk_cache = None
+        self._disk_cache_dirty = False
+        if persistent and self.disk_cache_file is not None:
+            try:
+                self.disk_cache_file.unlink(missing_ok=True)
+            except OSError as e:
+                self.logger.debug(
+                    "Could not remove wheel cache %s: %s", self.disk_cache_file, e
+                )
         self.logger.info("Wheel cache cleared")
 
     def get_wheel_dependencies(self, wheel_info: WheelInfo) -> List[str]:
@@ -11,17 +11,16 @@ import os
 import sys
 from pathlib import Path
 
+# PyInstaller creates a temp folder and stores path in _MEIPASS; in
+# development mode resources live next to this file
+_BASE_PATH = getattr(sys, "_MEIPASS", None) or os.path.dirname(
+    os.path.abspath(__file__)
+)
+
 
 def get_resource_path(relative_path):
     """Get absolute path to resource, works for dev and for PyInstaller"""
-    try:
-        # PyInstaller creates a temp folder and stores path in _MEIPASS
-        base_path = sys._MEIPASS
-    except AttributeError:
-        # Running in development mode
-        base_path = os.path.dirname(os.path.abspath(__file__))
-
-    return os.path.join(base_path, relative_path)
+    return os.path.join(_BASE_PATH, relative_path)
 
 
 def setup_environment():
@@ -35,7 +34,8 @@ def setup_environment():
     os.environ["OSI_EXECUTABLE_MODE"] = "1"
     os.environ["OSI_RESOURCE_PATH"] = get_resource_path("")
 
-    # Set paths for kits and wheels if they exist
+    # Set paths for kits and wheels if they exist. These two stat calls are
+    # cheaper than reading any cached record of the bundle layout would be.
     kits_path = get_resource_path("kits")
     if os.path.exists(kits_path):
         os.environ["OSI_KITS_PATH"] = kits_path
@@ -14,8 +14,15 @@ import sys
 import tempfile
 import urllib.request
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+DOWNLOAD_CHUNKS = 4
+MIN_CHUNK_SIZE = 1 << 20
+DOWNLOAD_RETRIES = 3
+DOWNLOAD_TIMEOUT = 60
+SPOOL_MAX_SIZE = 64 << 20
+
 
 def print_banner():
     """Print welcome banner."""
@@ -55,29 +62,73 @@ def check_requirements():
     return True
 
 
+def _fetch_range(url, start, end):
+    """Fetch bytes start..end (inclusive) of url, retrying on failure."""
+    error = None
+    for _ in range(DOWNLOAD_RETRIES):
+        request = urllib.request.Request(url, headers={"Range": f"bytes={start}-{end}"})
+        try:
+            with urllib.request.urlopen(request, timeout=DOWNLOAD_TIMEOUT) as response:
+                data = response.read()
+                if response.status == 206 and len(data) == end - start + 1:
+                    return data
+            error = OSError(f"Incomplete download of bytes {start}-{end}")
+        except OSError as e:
+            error = e
+    raise error
+
+
+def download_to(url, fileobj):
+    """Download url into fileobj, fetching byte ranges in parallel when possible."""
+    # A one-byte range request tells us whether ranges are supported and,
+    # through Content-Range, the full size of the file
+    request = urllib.request.Request(url, headers={"Range": "bytes=0-0"})
+    with urllib.request.urlopen(request, timeout=DOWNLOAD_TIMEOUT) as response:
+        if response.status != 206:
+            # Range ignored: the server is already sending the whole file
+            shutil.copyfileobj(response, fileobj)
+            return
+        total = response.headers.get("Content-Range", "").rpartition("/")[2]
+        url = response.geturl()
+
+    if not total.isdigit():
+        with urllib.request.urlopen(url, timeout=DOWNLOAD_TIMEOUT) as response:
+            shutil.copyfileobj(response, fileobj)
+        return
+
+    total = int(total)
+    chunks = max(1, min(DOWNLOAD_CHUNKS, total // MIN_CHUNK_SIZE))
+    chunk_size = -(-total // chunks)
+    ranges = [
+        (start, min(start + chunk_size, total) - 1)
+        for start in range(0, total, chunk_size)
+    ]
+    with ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+        for data in executor.map(lambda r: _fetch_range(url, *r), ranges):
+            fileobj.write(data)
+
+
 def download_osi():
     """Download OSI source code from GitHub."""
     print("\n📥 Downloading OSI from GitHub...")
 
-    import shutil
-    import tempfile
-    import zipfile
-
     # Create temporary directory
     temp_dir = Path(tempfile.mkdtemp())
 
     try:
         # Download OSI source from GitHub
         github_url = "https://github.com/ethan-li/osi/archive/refs/heads/main.zip"
-        zip_path = temp_dir / "osi.zip"
 
-        print("Downloading OSI source code...")
-        urllib.request.urlretrieve(github_url, zip_path)
+        # Keep the archive in memory unless it is unexpectedly large
+        with tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE) as archive:
+            print("Downloading OSI source code...")
+            download_to(github_url, archive)
 
-        # Extract the zip file
-        print("Extracting files...")
-        with zipfile.ZipFile(zip_path, "r") as zip_ref:
-            zip_ref.extractall(temp_dir)
+            # Extract the zip file
+            print("Extracting files...")
+            archive.seek(0)
+            with zipfile.ZipFile(archive, "r") as zip_ref:
+                zip_ref.extractall(temp_dir)
 
         # Find the extracted directory (should be osi-main)
         extracted_dir = temp_dir / "osi-main"
@@ -129,13 +180,20 @@ def setup_osi(source_dir):
 
     # Install dependencies
     print("Installing dependencies...")
-    deps = ["toml", "packaging", "virtualenv", "pkginfo"]
-    for dep in deps:
-        subprocess.run(
-            [str(python_exe), "-m", "pip", "install", dep],
-            check=True,
-            capture_output=True,
-        )
+    deps = ["packaging", "virtualenv", "pkginfo"]
+    subprocess.run(
+        [
+            str(python_exe),
+            "-m",
+            "pip",
+            "install",
+            "--disable-pip-version-check",
+            "--no-input",
+            *deps,
+        ],
+        check=True,
+        capture_output=True,
+    )
 
     # Copy OSI source
     print("Installing OSI...")
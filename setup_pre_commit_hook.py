@@ -37,10 +37,10 @@ def create_pre_commit_hook(fast_mode: bool = False) -> bool:
 
     # Determine the command to use
     if fast_mode:
-        command = "python pre_commit_check.py --fast"
+        command = "python pre_commit_check.py --staged --fast"
         mode_desc = "fast mode (skips tests and functional verification)"
     else:
-        command = "python pre_commit_check.py"
+        command = "python pre_commit_check.py --staged"
         mode_desc = "full validation"
 
     # Create the hook script
@@ -180,7 +180,7 @@ def check_dependencies() -> bool:
         print(f"")
         print(f"Please install missing dependencies:")
         if "mypy" in missing_tools:
-            print(f"  pip install mypy types-toml")
+            print(f"  pip install mypy")
         if "black" in missing_tools:
             print(f"  pip install black")
         if "isort" in missing_tools:
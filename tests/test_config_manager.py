@@ -12,6 +12,7 @@ import sys
 import tempfile
 import unittest
 from pathlib import Path
+from unittest.mock import patch
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -114,6 +115,16 @@ class TestConfigManager(unittest.TestCase):
             is_valid, "Non-existent tool should have invalid configuration"
         )
 
+    def test_iter_tool_configs(self):
+        """Test iterating over all tool configurations in one pass."""
+        tools = self.config_manager.list_tools()
+        configs = list(self.config_manager.iter_tool_configs())
+
+        self.assertEqual([name for name, _ in configs], tools)
+        for tool_name, config in configs:
+            self.assertTrue(self.config_manager.check_tool_config(tool_name, config))
+            self.assertIs(config, self.config_manager.load_tool_config(tool_name))
+
     def test_get_tool_dependencies(self):
         """Test getting tool dependencies."""
         tools = self.config_manager.list_tools()
@@ -182,6 +193,31 @@ class TestConfigManagerCaching(unittest.TestCase):
         else:
             self.skipTest("No tools available for testing")
 
+    def test_install_kit_keeps_wheel_cache(self):
+        """Test that installing a kit keeps the parsed info of its wheels."""
+        temp_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, temp_dir, ignore_errors=True)
+        wheel_manager = self.config_manager.wheel_manager
+        wheel_manager.kits_dir = temp_dir / "kits"
+        wheel_manager.disk_cache_file = None
+        source_kit = temp_dir / "new_kit"
+        source_kit.mkdir()
+        shutil.copy2(
+            Path(__file__).parent
+            / "kits"
+            / "test_kit"
+            / "text_processor-1.0.0-py3-none-any.whl",
+            source_kit,
+        )
+
+        self.assertEqual(wheel_manager.discover_wheels([wheel_manager.kits_dir]), [])
+        self.assertTrue(self.config_manager.install_kit(source_kit))
+        with patch.object(wheel_manager, "_extract_wheel_info_manually") as extract:
+            wheels = wheel_manager.discover_wheels([wheel_manager.kits_dir])
+        extract.assert_not_called()
+        self.assertEqual(len(wheels), 1)
+        self.assertEqual(wheels[0].path.parent, wheel_manager.kits_dir / "new_kit")
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
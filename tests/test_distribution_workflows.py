@@ -209,7 +209,7 @@ class TestDistributionArtifacts(unittest.TestCase):
             content = f.read()
 
         # Should contain core dependencies
-        core_dependencies = ["toml", "packaging", "virtualenv"]
+        core_dependencies = ["packaging", "virtualenv"]
 
         for dep in core_dependencies:
             self.assertIn(dep, content, f"requirements.txt should contain {dep}")
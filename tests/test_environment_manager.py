@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Unit tests for OSI EnvironmentManager
+
+Tests environment creation, listing, and removal.
+"""
+
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from osi.environment_manager import EnvironmentManager, _fast_rmtree
+from osi.utils import is_windows, setup_logging
+
+
+class TestEnvironmentManager(unittest.TestCase):
+    """Test cases for EnvironmentManager class."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up test environment once for all tests."""
+        setup_logging("WARNING")
+
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.env_manager = EnvironmentManager()
+        self.env_manager.environments_dir = self.temp_dir
+        self.env_manager.seed_dir = self.temp_dir / ".seed"
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_list_environments_empty(self):
+        """Test listing environments in an empty directory."""
+        self.assertEqual(self.env_manager.list_environments(), [])
+
+    def test_remove_nonexistent_environment(self):
+        """Test removing an environment that does not exist."""
+        self.assertTrue(self.env_manager.remove_environment("non_existent_tool"))
+
+    @unittest.skipIf(is_windows(), "Seed cloning is POSIX-only")
+    def test_create_environment_from_seed(self):
+        """Test that cloned environments point at their own path."""
+        self.assertTrue(self.env_manager.create_environment("tool_a"))
+        self.assertTrue(self.env_manager.create_environment("tool_b"))
+
+        self.assertEqual(self.env_manager.list_environments(), ["tool_a", "tool_b"])
+
+        env_path = self.env_manager.get_environment_path("tool_b")
+        pip_script = self.env_manager.get_environment_pip("tool_b")
+        shebang = pip_script.read_text(encoding="utf-8").splitlines()[0]
+        self.assertEqual(shebang, f"#!{env_path / 'bin' / 'python'}")
+
+        seed_pip = self.env_manager.seed_dir / "bin" / "pip"
+        self.assertIn(
+            str(self.env_manager.seed_dir),
+            seed_pip.read_text(encoding="utf-8").splitlines()[0],
+        )
+
+    def test_run_in_environment(self):
+        """Test that commands run with the tool's environment activated."""
+        self.assertTrue(self.env_manager.create_environment("tool_a"))
+        env_path = self.env_manager.get_environment_path("tool_a")
+
+        for _ in range(2):
+            result = self.env_manager.run_in_environment(
+                "tool_a",
+                ["python", "-c", "import os; print(os.environ['VIRTUAL_ENV'])"],
+            )
+            self.assertEqual(result.stdout.strip(), str(env_path))
+
+    def test_run_in_missing_environment(self):
+        """Test running a command in an environment that does not exist."""
+        with self.assertRaises(RuntimeError):
+            self.env_manager.run_in_environment("non_existent_tool", ["python"])
+
+    def test_validate_environment(self):
+        """Test validating environments with and without a venv marker."""
+        self.assertTrue(self.env_manager.create_environment("tool_a"))
+        self.assertTrue(self.env_manager.validate_environment("tool_a"))
+        self.assertTrue(self.env_manager.validate_environment("tool_a", deep=True))
+
+        # Package names are compared in canonical form
+        self.assertTrue(
+            self.env_manager.validate_environment("tool_a", ["PIP>=1.0", "SetupTools"])
+        )
+        self.assertFalse(
+            self.env_manager.validate_environment("tool_a", ["non_existent_pkg"])
+        )
+
+        env_path = self.env_manager.get_environment_path("tool_a")
+        (env_path / "pyvenv.cfg").unlink()
+        self.assertFalse(self.env_manager.validate_environment("tool_a"))
+
+
+class TestFastRmtree(unittest.TestCase):
+    """Test cases for the parallel directory removal helper."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_removes_nested_tree(self):
+        """Test removing a nested tree of files."""
+        tree = self.temp_dir / "env"
+        for i in range(5):
+            package_dir = tree / "lib" / f"pkg{i}" / "sub"
+            package_dir.mkdir(parents=True)
+            for j in range(10):
+                (package_dir / f"mod{j}.py").write_text("x = 1\n")
+
+        _fast_rmtree(tree)
+        self.assertFalse(tree.exists())
+
+    @unittest.skipIf(is_windows(), "Symlinks require privileges on Windows")
+    def test_does_not_follow_symlinks(self):
+        """Test that symlinked directories are unlinked, not traversed."""
+        outside = self.temp_dir / "outside"
+        outside.mkdir()
+        (outside / "keep.txt").write_text("keep")
+
+        tree = self.temp_dir / "env"
+        tree.mkdir()
+        (tree / "link").symlink_to(outside, target_is_directory=True)
+
+        _fast_rmtree(tree)
+        self.assertFalse(tree.exists())
+        self.assertTrue((outside / "keep.txt").exists())
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
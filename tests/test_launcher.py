@@ -18,7 +18,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from osi.config_manager import ConfigManager
 from osi.environment_manager import EnvironmentManager
-from osi.launcher import Launcher
+from osi.launcher import Launcher, _fast_parse_args, create_parser
 from osi.utils import setup_logging
 
 
@@ -90,6 +90,40 @@ class TestLauncher(unittest.TestCase):
         except Exception as e:
             self.fail(f"doctor() raised an exception: {e}")
 
+    def test_clean(self):
+        """Test that clean removes every environment and cache."""
+        temp_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, temp_dir, ignore_errors=True)
+        env_dir = temp_dir / "environments"
+        cache_dir = temp_dir / "cache"
+        env_manager = self.launcher.env_manager
+        env_manager.environments_dir = env_dir
+        env_manager.seed_dir = env_dir / ".seed"
+        env_manager.cache_dir = cache_dir
+        self.launcher.config_manager.wheel_manager.disk_cache_file = None
+
+        for tool_name in ("tool_a", "tool_b", "tool_c"):
+            python_path = env_manager.get_environment_python(tool_name)
+            python_path.parent.mkdir(parents=True)
+            python_path.touch()
+        self.assertEqual(len(env_manager.list_environments()), 3)
+        env_manager.seed_dir.mkdir()
+        (env_manager.seed_dir / "pyvenv.cfg").touch()
+
+        (cache_dir / "pip").mkdir(parents=True)
+        (cache_dir / "pip" / "selfcheck.json").touch()
+
+        self.launcher.clean()
+        self.assertEqual(env_manager.list_environments(), [])
+        self.assertEqual(list(env_dir.iterdir()), [])
+        self.assertFalse((cache_dir / "pip").exists())
+
+    def test_map_tools_preserves_order(self):
+        """Test that concurrent per-tool work keeps the tool order."""
+        tools = [f"tool_{i}" for i in range(40)]
+        results = self.launcher._map_tools(str.upper, tools)
+        self.assertEqual(results, [tool.upper() for tool in tools])
+
 
 class TestLauncherToolManagement(unittest.TestCase):
     """Test cases for tool management in Launcher."""
@@ -211,5 +245,36 @@ class TestLauncherIntegration(unittest.TestCase):
             self.skipTest("No tools available for integration testing")
 
 
+class TestLauncherArgumentParsing(unittest.TestCase):
+    """Test cases for command-line argument parsing."""
+
+    def test_fast_parse_matches_argparse(self):
+        """Test that plain command lines parse the same as with argparse."""
+        parser = create_parser()
+        for argv in (
+            ["list"],
+            ["install", "my_tool"],
+            ["run", "my_tool"],
+            ["run", "my_tool", "input.txt", "output.txt"],
+            ["uninstall", "my_tool"],
+            ["info", "my_tool"],
+            ["doctor"],
+            ["clean"],
+            ["list-kits"],
+            ["install-kit", "/path/to/kit"],
+            ["kit-info", "my_kit"],
+        ):
+            with self.subTest(argv=argv):
+                self.assertEqual(
+                    vars(_fast_parse_args(argv)), vars(parser.parse_args(argv))
+                )
+
+    def test_fast_parse_defers_to_argparse(self):
+        """Test that options and malformed command lines are left to argparse."""
+        for argv in ([], ["--help"], ["-v", "list"], ["install"], ["unknown"]):
+            with self.subTest(argv=argv):
+                self.assertIsNone(_fast_parse_args(argv))
+
+
 if __name__ == "__main__":
     unittest.main(verbosity=2)
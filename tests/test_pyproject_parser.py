@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Unit tests for OSI PyProjectParser
+
+Tests pyproject.toml parsing and conversion of wheel metadata.
+"""
+
+import shutil
+import sys
+import tempfile
+import unittest
+from dataclasses import replace
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from osi.pyproject_parser import PyProjectParser
+from osi.utils import setup_logging
+from osi.wheel_manager import WheelInfo
+
+PYPROJECT_TEMPLATE = """
+[project]
+name = "sample-tool"
+version = "{version}"
+dependencies = ["requests>=2.0"]
+
+[project.scripts]
+sample-tool = "sample_tool.main:main"
+"""
+
+
+class TestPyProjectParser(unittest.TestCase):
+    """Test cases for PyProjectParser class."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up test environment once for all tests."""
+        setup_logging("WARNING")
+
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.pyproject_path = self.temp_dir / "pyproject.toml"
+        self.pyproject_path.write_text(PYPROJECT_TEMPLATE.format(version="1.0.0"))
+        self.parser = PyProjectParser()
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_parse_file(self):
+        """Test parsing a pyproject.toml file."""
+        config = self.parser.parse_file(self.pyproject_path)
+        self.assertIsNotNone(config)
+        self.assertEqual(config.name, "sample-tool")
+        self.assertEqual(config.version, "1.0.0")
+        self.assertEqual(config.dependencies, ["requests>=2.0"])
+        self.assertIn("sample-tool", config.console_scripts)
+
+    def test_parse_missing_file(self):
+        """Test parsing a pyproject.toml file that does not exist."""
+        self.assertIsNone(self.parser.parse_file(self.temp_dir / "missing.toml"))
+
+    def test_parse_from_wheel(self):
+        """Test creating a config from wheel metadata."""
+        wheel_info = WheelInfo(
+            name="sample-tool",
+            version="1.2.0",
+            filename="sample_tool-1.2.0-py3-none-any.whl",
+            path=self.temp_dir / "sample_tool-1.2.0-py3-none-any.whl",
+            metadata={},
+            dependencies=["requests>=2.0"],
+            entry_points={"sample-tool": "sample_tool.main:main"},
+        )
+
+        config = self.parser.parse_from_wheel(wheel_info)
+        self.assertEqual(config.name, "sample-tool")
+        self.assertEqual(config.authors, [])
+        self.assertEqual(config.to_tool_config().entry_point, "sample-tool")
+
+        self.assertIsNone(self.parser.parse_from_wheel(replace(wheel_info, name="")))
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Unit tests for OSI ToolConfig
+
+Tests conversion between ToolConfig objects and their dictionary form.
+"""
+
+import sys
+import unittest
+from dataclasses import fields
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from osi.tool_config import _FIELD_MAP, _SECTIONS, ToolConfig
+
+
+class TestToolConfig(unittest.TestCase):
+    """Test cases for ToolConfig class."""
+
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.data = {
+            "tool": {
+                "name": "my_tool",
+                "version": "2.0.0",
+                "description": "A test tool",
+                "keywords": ["test"],
+            },
+            "dependencies": {"python": ">=3.12", "packages": ["requests>=2.0"]},
+            "entry_points": {"console_script": "my-tool"},
+            "platform": {"linux_only": True},
+            "install": {"post_install": ["echo done"]},
+        }
+
+    def test_from_dict(self):
+        """Test creating a ToolConfig from dictionary data."""
+        config = ToolConfig.from_dict(self.data)
+
+        self.assertEqual(config.name, "my_tool")
+        self.assertEqual(config.version, "2.0.0")
+        self.assertEqual(config.python_version, ">=3.12")
+        self.assertEqual(config.dependencies, ["requests>=2.0"])
+        self.assertEqual(config.entry_point, "my-tool")
+        self.assertIsNone(config.module)
+        self.assertTrue(config.linux_only)
+        self.assertFalse(config.windows_only)
+        self.assertEqual(config.post_install_commands, ["echo done"])
+        self.assertEqual(config.pre_install_commands, [])
+
+    def test_from_empty_dict(self):
+        """Test that missing sections fall back to defaults."""
+        config = ToolConfig.from_dict({})
+        self.assertEqual(config, ToolConfig(name=""))
+
+        # Defaults are not shared between instances
+        self.assertIsNot(config.dependencies, ToolConfig.from_dict({}).dependencies)
+
+    def test_round_trip(self):
+        """Test that to_dict and from_dict round-trip."""
+        config = ToolConfig.from_dict(self.data)
+        self.assertEqual(ToolConfig.from_dict(config.to_dict()), config)
+        self.assertEqual(
+            list(config.to_dict()),
+            ["tool", "dependencies", "entry_points", "platform", "install"],
+        )
+
+    def test_repeated_strings_are_shared(self):
+        """Test that low-cardinality strings are shared between configs."""
+        first = ToolConfig.from_dict({"tool": {"version": "".join(["2.", "0"])}})
+        second = ToolConfig.from_dict({"tool": {"version": "".join(["2.", "0"])}})
+        self.assertIs(first.version, second.version)
+        self.assertIs(ToolConfig(name="a").version, ToolConfig.from_dict({}).version)
+
+    def test_field_map_covers_all_fields(self):
+        """Test that every field is serialized through the shared field map."""
+        mapped = [field_name for field_name, _, _, _ in _FIELD_MAP]
+        self.assertCountEqual(mapped, [f.name for f in fields(ToolConfig)])
+        self.assertTrue(all(section in _SECTIONS for _, section, _, _ in _FIELD_MAP))
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
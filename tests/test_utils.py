@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Unit tests for OSI utility functions
+"""
+
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from osi.utils import (
+    ensure_directory,
+    forget_directory,
+    get_default_wheels_paths,
+    run_commands,
+    sanitize_name,
+    validate_python_version,
+)
+
+
+class TestEnsureDirectory(unittest.TestCase):
+    """Test cases for ensure_directory."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_recreated_after_forget(self):
+        """Test that a removed directory is only recreated once forgotten."""
+        path = self.temp_dir / "a" / "b"
+        ensure_directory(path)
+        self.assertTrue(path.is_dir())
+
+        path.rmdir()
+        ensure_directory(path)
+        self.assertFalse(path.exists())
+
+        forget_directory(path)
+        ensure_directory(path)
+        self.assertTrue(path.is_dir())
+
+
+class TestDefaultPaths(unittest.TestCase):
+    """Test cases for the default kits and wheels search paths."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_directory_created_later_is_found(self):
+        """Test that a wheels directory created after first use is picked up."""
+        wheels_dir = self.temp_dir / ".osi" / "wheels"
+        with patch.object(Path, "home", return_value=self.temp_dir):
+            self.assertNotIn(wheels_dir, get_default_wheels_paths())
+
+            wheels_dir.mkdir(parents=True)
+            self.assertIn(wheels_dir, get_default_wheels_paths())
+
+
+class TestSanitizeName(unittest.TestCase):
+    """Test cases for sanitize_name."""
+
+    def test_replaces_invalid_characters(self):
+        """Test that filesystem-unsafe characters become underscores."""
+        self.assertEqual(sanitize_name('a<b>c:d"e/f\\g|h?i*j'), "a_b_c_d_e_f_g_h_i_j")
+
+    def test_non_ascii_name(self):
+        """Test that non-ASCII names are sanitized the same way."""
+        self.assertEqual(sanitize_name("outil/é*"), "outil_é_")
+
+    def test_strips_dots_and_whitespace(self):
+        """Test that leading and trailing dots and spaces are removed."""
+        self.assertEqual(sanitize_name(" .my_tool. "), "my_tool")
+
+    def test_empty_name(self):
+        """Test that names that sanitize to nothing get a placeholder."""
+        self.assertEqual(sanitize_name(".."), "unnamed_tool")
+
+
+class TestValidatePythonVersion(unittest.TestCase):
+    """Test cases for validate_python_version."""
+
+    def test_versions(self):
+        """Test comparing the running interpreter against minimum versions."""
+        major, minor = sys.version_info[:2]
+        self.assertTrue(validate_python_version(f"{major}.{minor}"))
+        self.assertTrue(validate_python_version(f"{major}.{minor}.99"))
+        self.assertTrue(validate_python_version(str(major)))
+        self.assertFalse(validate_python_version(f"{major}.{minor + 1}"))
+        self.assertFalse(validate_python_version(f"{major + 1}.0"))
+
+
+class TestRunCommands(unittest.TestCase):
+    """Test cases for run_commands."""
+
+    def test_results_in_order(self):
+        """Test that results are returned in command order."""
+        commands = [[sys.executable, "-c", f"print({i})"] for i in range(4)]
+        results = run_commands(commands)
+        self.assertEqual([r.stdout.strip() for r in results], ["0", "1", "2", "3"])
+
+    def test_commands_overlap(self):
+        """Test that commands run concurrently."""
+        command = [sys.executable, "-c", "import time; time.sleep(0.5)"]
+        start = time.monotonic()
+        run_commands([command] * 4, max_workers=4)
+        self.assertLess(time.monotonic() - start, 1.5)
+
+    def test_failure_raises(self):
+        """Test that a failing command raises when check=True."""
+        commands = [[sys.executable, "-c", "pass"], [sys.executable, "-c", "exit(3)"]]
+        with self.assertRaises(subprocess.CalledProcessError):
+            run_commands(commands)
+        results = run_commands(commands, check=False)
+        self.assertEqual([r.returncode for r in results], [0, 3])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
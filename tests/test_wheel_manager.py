@@ -5,11 +5,14 @@ Unit tests for OSI WheelManager
 Tests the wheel discovery, validation, and management functionality.
 """
 
+import os
 import shutil
 import sys
 import tempfile
 import unittest
+import zipfile
 from pathlib import Path
+from unittest.mock import patch
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -29,6 +32,8 @@ class TestWheelManager(unittest.TestCase):
     def setUp(self):
         """Set up test fixtures before each test method."""
         self.wheel_manager = WheelManager()
+        # Keep the persistent cache out of the project tree
+        self.wheel_manager.disk_cache_file = None
         self.test_kits_dir = Path(__file__).parent / "kits"
 
     def test_initialization(self):
@@ -69,6 +74,83 @@ class TestWheelManager(unittest.TestCase):
         else:
             self.skipTest("Test kits directory not available")
 
+    def test_discover_wheels_reuses_unchanged_directories(self):
+        """Test that discovery only walks again after a directory changes."""
+        temp_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, temp_dir, ignore_errors=True)
+        test_wheel = (
+            self.test_kits_dir / "test_kit" / ("text_processor-1.0.0-py3-none-any.whl")
+        )
+        (temp_dir / "kit_a").mkdir()
+        shutil.copy2(test_wheel, temp_dir / "kit_a")
+
+        self.assertEqual(len(self.wheel_manager.discover_wheels([temp_dir])), 1)
+        with patch("osi.wheel_manager.os.walk") as walk:
+            self.wheel_manager.discover_wheels([temp_dir])
+        walk.assert_not_called()
+
+        (temp_dir / "kit_b").mkdir()
+        shutil.copy2(test_wheel, temp_dir / "kit_b")
+        self.assertEqual(len(self.wheel_manager.discover_wheels([temp_dir])), 2)
+
+    def test_wheel_info_cache_invalidated_on_overwrite(self):
+        """Test that a wheel replaced at the same path is parsed again."""
+        temp_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, temp_dir, ignore_errors=True)
+        wheel_path = temp_dir / "text_processor-1.0.0-py3-none-any.whl"
+        shutil.copy2(self.test_kits_dir / "test_kit" / wheel_path.name, wheel_path)
+
+        first = self.wheel_manager.get_wheel_info(wheel_path)
+        self.assertIs(self.wheel_manager.get_wheel_info(wheel_path), first)
+
+        st = wheel_path.stat()
+        os.utime(wheel_path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+        second = self.wheel_manager.get_wheel_info(wheel_path)
+        self.assertIsNot(second, first)
+        self.assertEqual(second, first)
+
+    def test_discover_wheels_after_overwrite(self):
+        """Test that discovery picks up a wheel overwritten at the same path."""
+        temp_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, temp_dir, ignore_errors=True)
+        kit_dir = temp_dir / "kit"
+        kit_dir.mkdir()
+        wheel_path = kit_dir / "sample_tool-1.0.0-py3-none-any.whl"
+        source = temp_dir / "source.whl"
+
+        # Built outside the kit, so copying only rewrites the wheel's contents
+        # and leaves the kit directory's mtime alone
+        for summary in ("Old summary", "A newer, longer summary"):
+            with zipfile.ZipFile(source, "w") as wheel_zip:
+                wheel_zip.writestr(
+                    "sample_tool-1.0.0.dist-info/METADATA",
+                    "Metadata-Version: 2.1\nName: sample-tool\n"
+                    f"Version: 1.0.0\nSummary: {summary}\n",
+                )
+            shutil.copyfile(source, wheel_path)
+
+            wheels = self.wheel_manager.discover_wheels([kit_dir])
+            self.assertEqual([wheel.summary for wheel in wheels], [summary])
+            self.assertEqual(
+                self.wheel_manager.get_wheel_info(wheel_path).summary, summary
+            )
+
+    def test_wheel_info_disk_cache(self):
+        """Test that parsed wheel info is reused by a later manager."""
+        temp_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, temp_dir, ignore_errors=True)
+        self.wheel_manager.disk_cache_file = temp_dir / "wheel_info.pkl"
+
+        wheels = self.wheel_manager.discover_wheels([self.test_kits_dir])
+        self.assertTrue(self.wheel_manager.disk_cache_file.exists())
+
+        other = WheelManager()
+        other.disk_cache_file = self.wheel_manager.disk_cache_file
+        with patch.object(other, "_extract_wheel_info_manually") as extract:
+            cached = other.discover_wheels([self.test_kits_dir])
+        extract.assert_not_called()
+        self.assertEqual(cached, wheels)
+
     def test_get_wheel_info(self):
         """Test extracting information from wheel files."""
         wheels = self.wheel_manager.discover_wheels()
@@ -106,6 +188,50 @@ class TestWheelManager(unittest.TestCase):
         non_existent = self.wheel_manager.find_wheel_by_name("non_existent_tool_12345")
         self.assertIsNone(non_existent, "Should not find non-existent wheel")
 
+    def test_find_wheel_by_name_first_match_wins(self):
+        """Test that the earliest wheel matching any name kind is returned."""
+        wheels = [
+            WheelInfo(
+                name="alpha",
+                version="1.0.0",
+                filename="alpha-1.0.0-py3-none-any.whl",
+                path=Path("alpha-1.0.0-py3-none-any.whl"),
+                metadata={},
+                dependencies=[],
+                entry_points={"beta": "alpha.cli:main"},
+            ),
+            WheelInfo(
+                name="beta",
+                version="1.0.0",
+                filename="beta-1.0.0-py3-none-any.whl",
+                path=Path("beta-1.0.0-py3-none-any.whl"),
+                metadata={},
+                dependencies=[],
+                entry_points={},
+            ),
+        ]
+        with patch.object(self.wheel_manager, "_discover", return_value=wheels):
+            self.assertIs(self.wheel_manager.find_wheel_by_name("beta", []), wheels[0])
+            self.assertIs(self.wheel_manager.find_wheel_by_name("alpha", []), wheels[0])
+            self.assertIsNone(self.wheel_manager.find_wheel_by_name("gamma", []))
+
+    def test_parse_metadata(self):
+        """Test parsing METADATA headers with repeated and folded values."""
+        metadata = self.wheel_manager._parse_metadata(
+            "Metadata-Version: 2.1\n"
+            "Name: sample\n"
+            "License: MIT\n"
+            "  and more\n"
+            "Requires-Dist: click\n"
+            "Requires-Dist: colorama\n"
+            "\n"
+            "Long description\n"
+            "Name: not-a-header\n"
+        )
+        self.assertEqual(metadata["Name"], "sample")
+        self.assertEqual(metadata["License"], "MIT\n  and more")
+        self.assertEqual(metadata["Requires-Dist"], ["click", "colorama"])
+
     def test_list_available_tools(self):
         """Test listing available tools from wheels."""
         tools = self.wheel_manager.list_available_tools()
@@ -132,6 +258,20 @@ class TestWheelManager(unittest.TestCase):
         is_valid = self.wheel_manager.validate_wheel(non_existent_path)
         self.assertFalse(is_valid, "Non-existent wheel should be invalid")
 
+    def test_validate_wheel_rejects_bad_archives(self):
+        """Test that files that are not wheels with metadata are invalid."""
+        temp_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, temp_dir, ignore_errors=True)
+
+        not_zip = temp_dir / "broken-1.0-py3-none-any.whl"
+        not_zip.write_bytes(b"not a zip file")
+        self.assertFalse(self.wheel_manager.validate_wheel(not_zip))
+
+        no_metadata = temp_dir / "empty-1.0-py3-none-any.whl"
+        with zipfile.ZipFile(no_metadata, "w") as wheel_zip:
+            wheel_zip.writestr("empty/__init__.py", "")
+        self.assertFalse(self.wheel_manager.validate_wheel(no_metadata))
+
 
 class TestKitManagement(unittest.TestCase):
     """Test cases for kit management functionality."""
@@ -139,6 +279,7 @@ class TestKitManagement(unittest.TestCase):
     def setUp(self):
         """Set up test fixtures."""
         self.wheel_manager = WheelManager()
+        self.wheel_manager.disk_cache_file = None
 
     def test_list_kits(self):
         """Test listing available kits."""
@@ -149,6 +290,23 @@ class TestKitManagement(unittest.TestCase):
         for kit in kits:
             self.assertIsInstance(kit, str)
 
+    def test_list_kits_only_with_wheels(self):
+        """Test that only directories containing wheels are listed as kits."""
+        temp_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, temp_dir, ignore_errors=True)
+        self.wheel_manager.kits_dir = temp_dir
+
+        for kit_name, filename in (
+            ("kit_b", "b-1.0-py3-none-any.whl"),
+            ("kit_a", "a-1.0-py3-none-any.whl"),
+            ("not_a_kit", "README.txt"),
+        ):
+            (temp_dir / kit_name).mkdir()
+            (temp_dir / kit_name / filename).touch()
+        (temp_dir / "loose-1.0-py3-none-any.whl").touch()
+
+        self.assertEqual(self.wheel_manager.list_kits(), ["kit_a", "kit_b"])
+
     def test_get_kit_tools(self):
         """Test getting tools from a specific kit."""
         kits = self.wheel_manager.list_kits()
@@ -165,6 +323,31 @@ class TestKitManagement(unittest.TestCase):
         else:
             self.skipTest("No kits available for testing")
 
+    def test_create_kit_from_wheels(self):
+        """Test that wheels copied into a new kit are not parsed again."""
+        temp_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, temp_dir, ignore_errors=True)
+        self.wheel_manager.kits_dir = temp_dir
+        test_wheel = (
+            Path(__file__).parent
+            / "kits"
+            / "test_kit"
+            / "text_processor-1.0.0-py3-none-any.whl"
+        )
+
+        self.assertTrue(
+            self.wheel_manager.create_kit_from_wheels(
+                "new_kit", [test_wheel, temp_dir / "missing-1.0-py3-none-any.whl"]
+            )
+        )
+        with patch.object(
+            self.wheel_manager, "_extract_wheel_info_manually"
+        ) as extract:
+            tools = self.wheel_manager.get_kit_tools("new_kit")
+        extract.assert_not_called()
+        self.assertEqual(len(tools), 1)
+        self.assertEqual(tools[0].path, temp_dir / "new_kit" / test_wheel.name)
+
     def test_get_nonexistent_kit_tools(self):
         """Test getting tools from non-existent kit."""
         tools = self.wheel_manager.get_kit_tools("non_existent_kit_12345")